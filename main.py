@@ -21,6 +21,10 @@ def main():
     db = JsonDatabase(db_path)
     db.initialize()
 
+    # Skip Qt's opaque-sibling clipping on every repaint. Laid-out widgets only overlap in stacked
+    # overlays (the DetailsDialog match label over its chart), which are translucent and get repainted
+    # with what lies beneath them, so nothing relies on the clipping
+    os.environ.setdefault('QT_NO_SUBTRACTOPAQUESIBLINGS', '1')
     app = QApplication(sys.argv)
     app.setApplicationName('StriveFit')
     # Show splash screen if asset exists
@@ -17,6 +17,8 @@ class JsonDatabase:
         self._nco_file = os.path.join(self.data_dir, 'nco.json')
         # NCO Organizations store
         self._nco_orgs_file = os.path.join(self.data_dir, 'nco_orgs.json')
+        # Memoized list_competitor_companies(); reset whenever companies change
+        self._competitor_companies: Optional[List[Dict[str, Any]]] = None
 
     # ----- File helpers -----
     def _load_companies(self) -> List[Dict[str, Any]]:
@@ -29,9 +31,11 @@ class JsonDatabase:
         with open(self._companies_file, 'w', encoding='utf-8') as f:
             json.dump(companies, f, indent=2)
 
-    def _mcus_file(self, company_id: int) -> str:
+    def _mcus_file(self, company_id: int, comp: Optional[Dict[str, Any]] = None) -> str:
         # Prefer name-based slug file. Fallback to ID-based legacy filename.
-        comp = self.get_company_by_id(company_id)
+        # Bulk readers pass the company record they already loaded to skip re-reading companies.json
+        if comp is None:
+            comp = self.get_company_by_id(company_id)
         if comp:
             slug = self._slugify(comp.get('name', 'company'), company_id)
             return os.path.join(self.data_dir, f'mcus_{slug}.json')
@@ -48,9 +52,9 @@ class JsonDatabase:
             return s
         return f'company_{company_id}' if company_id is not None else 'company'
 
-    def _load_mcus(self, company_id: int) -> List[Dict[str, Any]]:
+    def _load_mcus(self, company_id: int, comp: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         # Try name-based file first
-        fp = self._mcus_file(company_id)
+        fp = self._mcus_file(company_id, comp)
         if os.path.exists(fp):
             with open(fp, 'r', encoding='utf-8') as f:
                 raw = json.load(f)
@@ -225,6 +229,11 @@ class JsonDatabase:
             comps = [c for c in comps if s in c['name'].lower()]
         return comps
 
+    def list_competitor_companies(self) -> List[Dict[str, Any]]:
+        if self._competitor_companies is None:
+            self._competitor_companies = [c for c in self.list_companies('') if not c.get('is_ours')]
+        return list(self._competitor_companies)
+
     def get_our_company_id(self) -> int:
         for c in self._load_companies():
             if c.get('is_ours') == 1:
@@ -243,6 +252,7 @@ class JsonDatabase:
                 c['is_ours'] = 0
         companies.append({"id": new_id, "name": name, "is_ours": int(is_ours)})
         self._save_companies(companies)
+        self._competitor_companies = None
         # Ensure a per-company mcus file exists
         if not os.path.exists(self._mcus_file(new_id)):
             self._save_mcus(new_id, [])
@@ -295,6 +305,7 @@ class JsonDatabase:
             if int(c.get('id')) == int(company_id):
                 c['name'] = new_name
         self._save_companies(companies)
+        self._competitor_companies = None
         # If old MCUs file exists and new one doesn't, rename it
         try:
             if os.path.exists(old_path) and (old_path != new_path):
@@ -330,6 +341,7 @@ class JsonDatabase:
         if len(companies) == before:
             return False
         self._save_companies(companies)
+        self._competitor_companies = None
         # Delete its MCU file if present
         try:
             fp = self._mcus_file(company_id)
@@ -391,9 +403,29 @@ class JsonDatabase:
     def all_mcus(self) -> List[Dict[str, Any]]:
         result: List[Dict[str, Any]] = []
         for c in self._load_companies():
-            result.extend(self._load_mcus(c['id']))
+            result.extend(self._load_mcus(c['id'], c))
         return result
 
+    def _iter_company_mcus(self, include_ours: bool):
+        # MCUs company by company in list_companies('') order, each company's sorted by name as
+        # list_mcus_by_company returns them; companies.json is read once for the whole pass
+        for c in self.list_companies(''):
+            if c.get('is_ours') and not include_ours:
+                continue
+            mcus = [m for m in self._load_mcus(c['id'], c) if m.get('company_id') == c['id']]
+            yield from sorted(mcus, key=lambda m: m['name'])
+
+    def list_all_competitor_mcus(self) -> List[Dict[str, Any]]:
+        # Every competitor MCU; same rows and order as list_mcus_by_company over
+        # list_companies('') with our company skipped
+        return list(self._iter_company_mcus(include_ours=False))
+
+    def list_all_mcus(self) -> List[Dict[str, Any]]:
+        # Lightweight id/name/company_id rows for every MCU in one call, ordered like
+        # list_companies + list_mcus_by_company so name lookups built from it resolve identically
+        return [{'id': m['id'], 'name': m['name'], 'company_id': m.get('company_id')}
+                for m in self._iter_company_mcus(include_ours=True)]
+
     # ----- NCO/Commission public API -----
     def add_nco_entry(self, company_id: int, comp_mcu_id: int, quantity: int, our_mcu_id: Optional[int] = None,
                       notes: str = '', org_id: Optional[int] = None) -> int:
@@ -421,6 +453,12 @@ class JsonDatabase:
             rows = [r for r in rows if int(r.get('org_id', 0)) == int(org_id)]
         return rows
 
+    def get_nco_entry_by_id(self, entry_id: int) -> Optional[Dict[str, Any]]:
+        for r in self._load_nco():
+            if int(r.get('id', -1)) == int(entry_id):
+                return r
+        return None
+
     def update_nco_entry(self, entry_id: int, *, company_id: Optional[int] = None,
                          comp_mcu_id: Optional[int] = None, quantity: Optional[int] = None,
                          our_mcu_id: Optional[int] = None, org_id: Optional[int] = None) -> bool:
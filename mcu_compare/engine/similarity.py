@@ -20,6 +20,10 @@ CORE_FAMILIES = {
     'PIC': 'PIC',
 }
 
+# Bump whenever the scoring rules change (similarity functions, weights handling, DSP/FPGA rules);
+# persisted score caches are keyed on it so scores from older rules are never reused
+SCORING_VERSION = 1
+
 DEFAULT_WEIGHTS: Dict[str, float] = {
     'core': 0.0,
     'core_mark': 0,
@@ -106,6 +110,23 @@ def coverage_similarity(requirement: float, offer: float) -> float:
     return min(1.0, off / req)
 
 
+# Boolean features scored with directional coverage
+_BOOL_DIR = {
+    'input_capture', 'ethernet', 'emif', 'spi_slave'
+}
+
+
+def _to01(x: Any) -> float:
+    try:
+        if isinstance(x, str):
+            xl = x.strip().lower()
+            if xl in ('yes', 'true', '1', 'y', 'on'): return 1.0
+            if xl in ('no', 'false', '0', 'off', ''): return 0.0
+        return 1.0 if float(x) > 0 else 0.0
+    except Exception:
+        return 1.0 if bool(x) else 0.0
+
+
 def feature_similarity(feature: str, comp_val: Any, our_val: Any) -> float:
     # Core comparison remains categorical/family-based
     if feature == 'core':
@@ -124,19 +145,7 @@ def feature_similarity(feature: str, comp_val: Any, our_val: Any) -> float:
     # Boolean features: directional coverage
     # - If competitor requires it (True) and we lack it => 0
     # - If competitor lacks it (False), we get full credit whether we have it or not; especially if we do, it's a plus
-    BOOL_DIR = {
-        'input_capture', 'ethernet', 'emif', 'spi_slave'
-    }
-    if feature in BOOL_DIR:
-        def _to01(x: Any) -> float:
-            try:
-                if isinstance(x, str):
-                    xl = x.strip().lower()
-                    if xl in ('yes', 'true', '1', 'y', 'on'): return 1.0
-                    if xl in ('no', 'false', '0', 'off', ''): return 0.0
-                return 1.0 if float(x) > 0 else 0.0
-            except Exception:
-                return 1.0 if bool(x) else 0.0
+    if feature in _BOOL_DIR:
         return coverage_similarity(_to01(comp_val), _to01(our_val))
     # Counts and other numerics treated as coverage
     try:
@@ -147,85 +156,170 @@ def feature_similarity(feature: str, comp_val: Any, our_val: Any) -> float:
     return coverage_similarity(xa, xb)
 
 
-def weighted_similarity(a: Dict[str, Any], b: Dict[str, Any], weights: Dict[str, float] = None) -> Tuple[float, Dict[str, float]]:
-    # Start from defaults if no explicit weights passed
-    if weights is None:
-        # Dynamic adjustment for max_clock_mhz based on competitor requirement (a)
-        base = dict(DEFAULT_WEIGHTS)
-        try:
-            req_clock = float(a.get('max_clock_mhz') or 0)
-        except Exception:
-            req_clock = 0.0
-        target_clock_w = base['max_clock_mhz']
-        if req_clock > 300:
-            target_clock_w = 0.20
-        elif req_clock > 200:
-            target_clock_w = 0.15
-        # If change is needed, scale other weights so the total stays constant
-        if abs(target_clock_w - base['max_clock_mhz']) > 1e-9:
-            total_default = sum(base.values())
-            remaining_default = total_default - base['max_clock_mhz']
-            remaining_target = total_default - target_clock_w
-            scale = remaining_target / remaining_default if remaining_default > 0 else 1.0
-            for k, v in list(base.items()):
-                if k == 'max_clock_mhz':
-                    base[k] = target_clock_w
-                else:
-                    base[k] = v * scale
-        # Normalize final weights to sum to 1.0 so percentages are intuitive
-        total_after = sum(base.values())
-        if total_after > 0:
-            base = {k: (v / total_after) for k, v in base.items()}
-        weights = base
-    # Business rule: if competitor is an FPGA, treat as no match outright
+def similarity_weights(a: Dict[str, Any]) -> Dict[str, float]:
+    """Default weights adjusted for competitor 'a' and normalized to sum to 1.0."""
+    # Dynamic adjustment for max_clock_mhz based on competitor requirement (a)
+    base = dict(DEFAULT_WEIGHTS)
+    try:
+        req_clock = float(a.get('max_clock_mhz') or 0)
+    except Exception:
+        req_clock = 0.0
+    target_clock_w = base['max_clock_mhz']
+    if req_clock > 300:
+        target_clock_w = 0.20
+    elif req_clock > 200:
+        target_clock_w = 0.15
+    # If change is needed, scale other weights so the total stays constant
+    if abs(target_clock_w - base['max_clock_mhz']) > 1e-9:
+        total_default = sum(base.values())
+        remaining_default = total_default - base['max_clock_mhz']
+        remaining_target = total_default - target_clock_w
+        scale = remaining_target / remaining_default if remaining_default > 0 else 1.0
+        for k, v in list(base.items()):
+            if k == 'max_clock_mhz':
+                base[k] = target_clock_w
+            else:
+                base[k] = v * scale
+    # Normalize final weights to sum to 1.0 so percentages are intuitive
+    total_after = sum(base.values())
+    if total_after > 0:
+        base = {k: (v / total_after) for k, v in base.items()}
+    return base
+
+
+def is_fpga(a: Dict[str, Any]) -> bool:
     core_str = str(a.get('core', '') or '')
     is_fpga_flag = False
     try:
         is_fpga_flag = bool(int(a.get('is_fpga', 0)))
     except Exception:
         is_fpga_flag = bool(a.get('is_fpga'))
-    if is_fpga_flag or ('fpga' in core_str.lower()):
+    return is_fpga_flag or ('fpga' in core_str.lower())
+
+
+def _is_dsp(a: Dict[str, Any]) -> bool:
+    try:
+        val = a.get('is_dsp', 0)
+        # Treat numeric/string '1', 'true' as True
+        if isinstance(val, str):
+            return val.strip().lower() in ('1', 'true', 'yes', 'y')
+        return bool(int(val)) if isinstance(val, (int, float)) else bool(val)
+    except Exception:
+        return False
+
+
+def _feature_value(d: Dict[str, Any], feat: str):
+    # Helper to support alias: 'DSP' can be used instead of 'dsp_core' in data
+    if feat == 'dsp_core':
+        return d.get('dsp_core', d.get('DSP'))
+    return d.get(feat)
+
+
+def score_from_weighted_sum(a: Dict[str, Any], weighted_sum: float, total_w: float) -> float:
+    """Overall percentage for competitor 'a' from sum(weight * feature score) and the weight total."""
+    # Business rule: if competitor is an FPGA, treat as no match outright
+    if is_fpga(a) or total_w <= 0:
+        return 0.0
+    pct = (weighted_sum / total_w) * 100.0
+    # DSP rule: apply 20% deduction ONLY if competitor JSON has is_dsp set
+    if _is_dsp(a):
+        pct = max(0.0, pct - 20.0)
+    return pct
+
+
+def weighted_similarity(a: Dict[str, Any], b: Dict[str, Any], weights: Dict[str, float] = None) -> Tuple[float, Dict[str, float]]:
+    # Start from defaults if no explicit weights passed
+    if weights is None:
+        weights = similarity_weights(a)
+    # Business rule: if competitor is an FPGA, treat as no match outright
+    if is_fpga(a):
         return 0.0, {feat: 0.0 for feat in weights.keys()}
 
     total_w = sum(weights.values())
     score = 0.0
     per_feature: Dict[str, float] = {}
-    # Helper to support alias: 'DSP' can be used instead of 'dsp_core' in data
-    def _get(d: Dict[str, Any], feat: str):
-        if feat == 'dsp_core':
-            return d.get('dsp_core', d.get('DSP'))
-        return d.get(feat)
     for feat, w in weights.items():
-        s = feature_similarity(feat, _get(a, feat), _get(b, feat))
+        s = feature_similarity(feat, _feature_value(a, feat), _feature_value(b, feat))
         per_feature[feat] = s
         score += w * s
     if total_w <= 0:
         return 0.0, per_feature
-    pct = (score / total_w) * 100.0
-    # DSP rule: apply 20% deduction ONLY if competitor JSON has is_dsp set
-    is_dsp_flag = False
+    return score_from_weighted_sum(a, score, total_w), per_feature
+
+
+def _coverage_operand(feature: str, val: Any):
+    # Value as feature_similarity feeds it to coverage_similarity; None when it would score 0.0
+    if feature == 'core':
+        return str(val)
+    if feature in _BOOL_DIR:
+        return _to01(val)
     try:
-        val = a.get('is_dsp', 0)
-        # Treat numeric/string '1', 'true' as True
-        if isinstance(val, str):
-            is_dsp_flag = val.strip().lower() in ('1', 'true', 'yes', 'y')
-        else:
-            is_dsp_flag = bool(int(val)) if isinstance(val, (int, float)) else bool(val)
+        return float(val or 0)
     except Exception:
-        is_dsp_flag = False
-    if is_dsp_flag:
-        pct = max(0.0, pct - 20.0)
-    return pct, per_feature
+        return None
+
+
+def _column_scores(feature: str, comp_val: Any, column: List[Any]) -> List[float]:
+    """feature_similarity(feature, comp_val, our) for every prepared OUR value in one pass."""
+    if feature == 'core':
+        a = str(comp_val)
+        return [core_similarity(a, b) for b in column]
+    req = _coverage_operand(feature, comp_val)
+    if req is None:
+        return [0.0] * len(column)
+    if req <= 0:
+        return [0.0 if off is None else 1.0 for off in column]
+    return [0.0 if off is None or off <= 0 else min(1.0, off / req) for off in column]
+
+
+def prepare_candidates(candidates: List[Dict[str, Any]], features=None) -> Dict[str, List[Any]]:
+    """Column-wise OUR feature values for best_match(columns=...).
+    Build once per candidate list and reuse it across targets; features missing here
+    (e.g. custom weights) are filled in on first use."""
+    if features is None:
+        features = DEFAULT_WEIGHTS.keys()
+    return {feat: [_coverage_operand(feat, _feature_value(c, feat)) for c in candidates] for feat in features}
 
 
-def best_match(target: Dict[str, Any], candidates: List[Dict[str, Any]], weights: Dict[str, float] = None) -> Tuple[Dict[str, Any], float, Dict[str, float]]:
-    best = None
+def best_match(target: Dict[str, Any], candidates: List[Dict[str, Any]], weights: Dict[str, float] = None,
+               columns: Dict[str, List[Any]] = None) -> Tuple[Dict[str, Any], float, Dict[str, float]]:
+    # Weights and competitor-side values depend only on the target; resolve them once
+    if weights is None:
+        weights = similarity_weights(target)
+    if is_fpga(target):
+        # FPGA competitors score 0 against everything; first candidate wins as before
+        if not candidates:
+            return None, -1.0, {}
+        return candidates[0], 0.0, {feat: 0.0 for feat in weights.keys()}
+    if columns is None:
+        columns = {}
+    total_w = sum(weights.values())
+    # Score feature by feature across all candidates; per-candidate sums accumulate
+    # in the same feature order as weighted_similarity, so results are identical
+    n = len(candidates)
+    sums = [0.0] * n
+    feat_scores = []
+    for feat, w in weights.items():
+        col = columns.get(feat)
+        if col is None:
+            col = columns[feat] = [_coverage_operand(feat, _feature_value(c, feat)) for c in candidates]
+        fs = _column_scores(feat, _feature_value(target, feat), col)
+        feat_scores.append((feat, fs))
+        for i in range(n):
+            sums[i] += w * fs[i]
+    # score_from_weighted_sum per candidate, with its target-only rules (FPGA above, DSP here) resolved once
+    if total_w > 0:
+        pcts = [(acc / total_w) * 100.0 for acc in sums]
+        if _is_dsp(target):
+            pcts = [max(0.0, pct - 20.0) for pct in pcts]
+    else:
+        pcts = [0.0] * n
+    best_i = -1
     best_score = -1.0
-    best_pf = {}
-    for c in candidates:
-        s, pf = weighted_similarity(target, c, weights)
+    for i, s in enumerate(pcts):
         if s > best_score:
-            best = c
+            best_i = i
             best_score = s
-            best_pf = pf
-    return best, best_score, best_pf
+    if best_i < 0:
+        return None, best_score, {}
+    return candidates[best_i], best_score, {feat: fs[best_i] for feat, fs in feat_scores}
@@ -1,12 +1,14 @@
+import os
+from html import escape
 from typing import Dict, Any
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QComboBox, QSpinBox,
-    QPushButton, QWidget, QFormLayout, QTableWidget, QTableWidgetItem, QHeaderView, QCheckBox, QProgressBar, QStackedLayout, QScrollArea
+    QPushButton, QWidget, QFormLayout, QTableWidget, QTableWidgetItem, QHeaderView, QCheckBox, QProgressBar, QStackedLayout, QScrollArea,
+    QProgressDialog, QStyledItemDelegate, QStyleOptionProgressBar, QStyle, QFileDialog, QMenu, QFrame, QSizePolicy, QMessageBox
 )
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QPainter, QGuiApplication, QIntValidator, QPalette, QDoubleValidator, QTextDocument, QKeySequence, QShortcut
+from PySide6.QtCore import Qt, QObject, QRunnable, QThreadPool, QSizeF, Signal
+from PySide6.QtGui import QPainter, QGuiApplication, QIntValidator, QPalette, QDoubleValidator, QTextDocument, QKeySequence, QShortcut, QPdfWriter, QPageLayout, QPageSize
 from PySide6.QtPrintSupport import QPrinter, QPrintDialog
-from PySide6.QtCharts import QChart, QChartView, QPieSeries
 
 from mcu_compare.engine.similarity import weighted_similarity, categorize
 
@@ -44,12 +46,138 @@ FEATURE_FIELDS = [
 ]
 
 
+# Summary bullet classification for DetailsDialog
+_MORE_IS_BETTER = frozenset({
+    'max_clock_mhz', 'flash_kb', 'sram_kb', 'gpios', 'uarts', 'spis', 'i2cs', 'pwms',
+    'timers', 'dacs', 'adcs', 'cans',
+    'output_compare', 'qspi', 'ext_interrupts'
+})
+# Booleans displayed as Yes/No (concise) — do not show 'vs'
+_BOOL_FIELDS = frozenset({'eeprom', 'power_mgmt', 'clock_mgmt', 'qei', 'internal_osc', 'security_features'})
+# Directional booleans (display only): treat as booleans for bullet text
+_BOOL_DIR_DISPLAY = frozenset({'input_capture', 'ethernet', 'emif', 'spi_slave'})
+# Both render the same Yes/No bullets
+_BOOL_ALL = _BOOL_FIELDS | _BOOL_DIR_DISPLAY
+_FPU_NAMES = {0: 'None', 1: 'Single precision', 2: 'Double precision'}
+# FEATURE_FIELDS classified once; textual fields (core) and unlisted keys produce no bullets
+_FIELD_KIND = [
+    (key, label, 'more' if key in _MORE_IS_BETTER else 'fpu' if key == 'fpu' else 'bool')
+    for key, label, _typ in FEATURE_FIELDS
+    if key in _MORE_IS_BETTER or key in _BOOL_ALL or key == 'fpu'
+]
+# Sidebar panel styles (better / lacks)
+_PANEL_OK_QSS = "QFrame { background: rgba(46, 125, 50, 0.10); border: 1px solid rgba(46,125,50,0.35); border-radius: 6px; padding: 6px; }"
+_PANEL_BAD_QSS = "QFrame { background: rgba(198, 40, 40, 0.10); border: 1px solid rgba(198,40,40,0.35); border-radius: 6px; padding: 6px; }"
+# Sidebar panel HTML pieces; bullets are joined between a fixed head and tail
+_BETTER_HEAD = (
+    "<div style='font-size:14px; line-height:1.35;'>"
+    "<div style='font-weight:700; font-size:15px; color:#2e7d32; margin-bottom:6px;'>Areas OUR MCU is better</div>"
+    "<ul style='list-style:none; margin:0; padding:0;'>"
+)
+_WORSE_HEAD = (
+    "<div style='font-size:14px; line-height:1.35;'>"
+    "<div style='font-weight:700; font-size:15px; color:#ffffff; margin-bottom:6px;'>Areas OUR MCU lacks</div>"
+    "<ul style='list-style:none; margin:0; padding:0;'>"
+)
+_PANEL_TAIL = "</ul></div>"
+_BULLET_OK = "<li><span style='color:#2e7d32; font-weight:700; margin-right:8px;'>✔</span>{}</li>"
+_BULLET_BAD = "<li><span style='color:#ef5350; font-weight:700; margin-right:8px;'>✖</span>{}</li>"
+
+
+def _panel_html(items: list, ok: bool) -> str:
+    bullet = _BULLET_OK if ok else _BULLET_BAD
+    head = _BETTER_HEAD if ok else _WORSE_HEAD
+    return head + "".join(bullet.format(escape(item)) for item in items) + _PANEL_TAIL
+
+
+# Converters take the isinstance fast path for values already stored as numbers
+# and only fall back to parsing (and exception handling) for strings/odd values
+def _numeric(val):
+    if isinstance(val, (int, float)):
+        return float(val)
+    try:
+        return float(val)
+    except Exception:
+        try:
+            return int(val)
+        except Exception:
+            return None
+
+
+def _to_int(val) -> int:
+    if isinstance(val, int):
+        return int(val)
+    if not val:
+        return 0
+    if isinstance(val, str) and val.isdecimal():
+        return int(val)
+    try:
+        return int(val)
+    except Exception:
+        return 0
+
+
+def _to_bool(val) -> int:
+    # Boolean features are set when they read as the integer 1; used for both cell text and bullets
+    return 1 if _to_int(val) == 1 else 0
+
+
+def _fmt_feature(key: str, typ: str, val) -> str:
+    # Display text for a FEATURE_FIELDS value: booleans as Yes/No, FPU level by name
+    if typ == 'bool':
+        return 'Yes' if _to_bool(val) else 'No'
+    if key == 'fpu':
+        if isinstance(val, int):
+            return _FPU_NAMES.get(val, str(val))
+        try:
+            return _FPU_NAMES.get(int(val), str(val))
+        except Exception:
+            return str(val)
+    return str(val)
+
+
+# Validators are stateless per field, so one shared instance per type serves every dialog.
+# Created lazily (no parent) so they outlive any single dialog.
+_INT_VALIDATOR = None
+_FLOAT_VALIDATOR = None
+
+
+def _int_validator() -> QIntValidator:
+    global _INT_VALIDATOR
+    if _INT_VALIDATOR is None:
+        _INT_VALIDATOR = QIntValidator(0, 100000)
+    return _INT_VALIDATOR
+
+
+def _float_validator() -> QDoubleValidator:
+    global _FLOAT_VALIDATOR
+    if _FLOAT_VALIDATOR is None:
+        _FLOAT_VALIDATOR = QDoubleValidator(0.0, 1e9, 3)
+        _FLOAT_VALIDATOR.setNotation(QDoubleValidator.StandardNotation)
+    return _FLOAT_VALIDATOR
+
+
+# Single-pass escaping for table cell text in print/export HTML
+_HTML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
+
 # Module-level safe HTML builders for DetailsDialog printing/exporting
 def _details_html_safe(dlg) -> str:
+    # Reuse the last HTML when the table shape and title are unchanged (e.g. Print then Export)
+    try:
+        sig = (dlg.table.rowCount(), dlg.table.columnCount(), dlg.header.text())
+    except Exception:
+        sig = None
+    cached = getattr(dlg, '_html_cache', None)
+    if sig is not None and cached is not None and cached[0] == sig:
+        return cached[1]
     try:
-        return _details_html_build(dlg)
+        html = _details_html_build(dlg)
     except Exception:
         return ''
+    if sig is not None and cached is not None:
+        dlg._html_cache = (sig, html)
+    return html
 
 
 def _details_html_build(dlg) -> str:
@@ -64,7 +192,6 @@ def _details_html_build(dlg) -> str:
     cols = tbl.columnCount()
     rows = tbl.rowCount()
     headers = [(tbl.horizontalHeaderItem(c).text() if tbl.horizontalHeaderItem(c) else '') for c in range(cols)]
-    from PySide6.QtWidgets import QLabel, QProgressBar
     def cell_text(r: int, c: int) -> str:
         w = tbl.cellWidget(r, c)
         if w is not None:
@@ -90,21 +217,96 @@ def _details_html_build(dlg) -> str:
         f'<div class="title">{title}</div>',
         '<table>'
     ]
-    html.append('<tr>')
-    for h in headers:
-        html.append(f'<th>{h}</th>')
-    html.append('</tr>')
+    html.append('<tr>' + ''.join(f'<th>{h}</th>' for h in headers) + '</tr>')
+    # One joined string per row keeps the parts list at O(rows) rather than O(rows*cols)
     for r in range(rows):
-        html.append('<tr>')
-        for c in range(cols):
-            txt = cell_text(r, c)
-            txt = (txt or '').replace('&','&amp;').replace('<','&lt;').replace('>','&gt;')
-            html.append(f'<td>{txt}</td>')
-        html.append('</tr>')
+        html.append('<tr>' + ''.join(f'<td>{(cell_text(r, c) or "").translate(_HTML_ESCAPE)}</td>' for c in range(cols)) + '</tr>')
     html.append('</table></body></html>')
     return ''.join(html)
 
 
+def _apply_print_layout(doc: QTextDocument, printer, last_key=None):
+    # Fit the document to the printer's paintable area; returns the layout key so callers
+    # holding a laid-out document can skip re-applying an unchanged page geometry
+    try:
+        paint = printer.pageLayout().paintRectPixels(printer.resolution())
+        key = (printer.resolution(), paint.width(), paint.height())
+        if key != last_key:
+            doc.setPageSize(QSizeF(paint.size()))
+            doc.setTextWidth(paint.width())
+        return key
+    except Exception:
+        return last_key
+
+
+class ProgressDelegate(QStyledItemDelegate):
+    # Paints a progress bar from the item's UserRole value (0-100) instead of a per-cell widget
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # One hidden bar serves as the style target so QProgressBar stylesheet rules still apply
+        self._bar = QProgressBar(parent)
+        self._bar.hide()
+
+    def paint(self, painter, option, index):
+        try:
+            value = float(index.data(Qt.UserRole) or 0.0)
+        except Exception:
+            value = 0.0
+        opt = QStyleOptionProgressBar()
+        opt.rect = option.rect.adjusted(6, 6, -6, -6)
+        opt.state = option.state | QStyle.State_Horizontal
+        opt.palette = option.palette
+        opt.fontMetrics = option.fontMetrics
+        opt.minimum = 0
+        opt.maximum = 100
+        opt.progress = int(round(value))
+        opt.text = index.data(Qt.DisplayRole) or ''
+        opt.textVisible = True
+        opt.textAlignment = Qt.AlignCenter
+        self._bar.ensurePolished()
+        self._bar.style().drawControl(QStyle.CE_ProgressBar, opt, painter, self._bar)
+
+
+class _PdfExportSignals(QObject):
+    # Emitted with the output path and the error text ('' once the PDF is written)
+    finished = Signal(str, str)
+
+
+class _PdfExportTask(QRunnable):
+    # Lays out and writes the details PDF off the GUI thread. A QTextDocument can't be shared
+    # across threads, so this builds its own from the cached HTML instead of reusing the
+    # dialog's _print_document (which Print keeps using on the GUI thread)
+    def __init__(self, html: str, path: str, signals: _PdfExportSignals):
+        super().__init__()
+        self.html = html
+        self.path = path
+        self.signals = signals
+
+    def run(self):
+        created = False
+        try:
+            # QPdfWriter fails silently on an unwritable path; opening it first surfaces the reason
+            created = not os.path.exists(self.path)
+            open(self.path, 'ab').close()
+            writer = QPdfWriter(self.path)
+            writer.setPageSize(QPageSize(QPageSize.A4))
+            writer.setPageOrientation(QPageLayout.Landscape)
+            writer.setResolution(300)
+            doc = QTextDocument()
+            doc.setHtml(self.html)
+            _apply_print_layout(doc, writer)
+            doc.print_(writer)
+            self.signals.finished.emit(self.path, '')
+        except Exception as e:
+            # Don't leave an empty or partial PDF behind where there was no file before
+            if created:
+                try:
+                    os.remove(self.path)
+                except OSError:
+                    pass
+            self.signals.finished.emit(self.path, str(e) or type(e).__name__)
+
+
 class AddMCUDialog(QDialog):
     def __init__(self, db, parent=None):
         super().__init__(parent)
@@ -131,13 +333,11 @@ class AddMCUDialog(QDialog):
                 w = QLineEdit()
             elif typ == 'int':
                 w = QLineEdit()
-                w.setValidator(QIntValidator(0, 100000, self))
+                w.setValidator(_int_validator())
                 w.setText('0')
             elif typ == 'float':
                 w = QLineEdit()
-                dv = QDoubleValidator(0.0, 1e9, 3, self)
-                dv.setNotation(QDoubleValidator.StandardNotation)
-                w.setValidator(dv)
+                w.setValidator(_float_validator())
                 w.setText('0')
             elif typ == 'bool':
                 w = QCheckBox()
@@ -212,7 +412,7 @@ class AddNcoEntryDialog(QDialog):
 
         # Competitor company selector
         self.company_combo = QComboBox()
-        self._companies = [c for c in self.db.list_companies('') if not c.get('is_ours')]
+        self._companies = self.db.list_competitor_companies()
         for c in self._companies:
             self.company_combo.addItem(c['name'], c['id'])
         self.company_combo.currentIndexChanged.connect(self._reload_comp_mcUs)
@@ -263,6 +463,8 @@ class AddNcoEntryDialog(QDialog):
 
 
 class ViewNcoEntriesDialog(QDialog):
+    ROW_HEIGHT = 28
+
     def __init__(self, db, parent=None):
         super().__init__(parent)
         self.db = db
@@ -272,10 +474,41 @@ class ViewNcoEntriesDialog(QDialog):
 
     def _build_ui(self):
         v = QVBoxLayout(self)
-        rows = self.db.list_nco_entries()
-        table = QTableWidget(len(rows), 4)
-        table.setHorizontalHeaderLabels(['Company', 'Competitor MCU', 'Quantity', 'Our MCU'])
-        table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.table = QTableWidget(0, 4)
+        self.table.setHorizontalHeaderLabels(['Company', 'Competitor MCU', 'Quantity', 'Our MCU'])
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        # Make the table display all rows with no internal scrolling; the dialog scrolls instead
+        self.table.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.table.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        # Uniform row height so the full table height is a single multiplication
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(self.ROW_HEIGHT)
+        self.refresh()
+        v.addWidget(self.table)
+
+
+        btn_row = QHBoxLayout()
+        print_btn = QPushButton('Print')
+        export_btn = QPushButton('Export PDF')
+        close_btn = QPushButton('Close')
+        print_btn.clicked.connect(self._print_details)
+        export_btn.clicked.connect(self._export_details_pdf)
+        close_btn.clicked.connect(self.accept)
+        btn_row.addWidget(print_btn)
+        btn_row.addWidget(export_btn)
+        btn_row.addWidget(close_btn)
+        v.addLayout(btn_row)
+        # Shortcuts similar to main window
+        sc_print = QShortcut(QKeySequence.Print, self)
+        sc_print.activated.connect(self._print_details)
+        sc_export = QShortcut(QKeySequence('Ctrl+Shift+P'), self)
+        sc_export.activated.connect(self._export_details_pdf)
+
+    def refresh(self, rows=None):
+        # Update the table in place; existing items are reused and only new rows get items
+        if rows is None:
+            rows = self.db.list_nco_entries()
+        table = self.table
 
         # Build lookup maps
         comps = {c['id']: c['name'] for c in self.db.list_companies('')}
@@ -284,64 +517,28 @@ class ViewNcoEntriesDialog(QDialog):
             for m in self.db.list_mcus_by_company(c['id']):
                 mcu_name[m['id']] = m['name']
 
+        table.setRowCount(len(rows))
         for i, r in enumerate(rows):
-            table.setItem(i, 0, QTableWidgetItem(comps.get(r.get('company_id'), '')))
-            table.setItem(i, 1, QTableWidgetItem(mcu_name.get(r.get('comp_mcu_id'), '')))
-            table.setItem(i, 2, QTableWidgetItem(str(r.get('quantity', 0))))
-            table.setItem(i, 3, QTableWidgetItem(mcu_name.get(r.get('our_mcu_id'), '')))
+            texts = (
+                comps.get(r.get('company_id'), ''),
+                mcu_name.get(r.get('comp_mcu_id'), ''),
+                str(r.get('quantity', 0)),
+                mcu_name.get(r.get('our_mcu_id'), ''),
+            )
+            for c, txt in enumerate(texts):
+                item = table.item(i, c)
+                if item is None:
+                    table.setItem(i, c, QTableWidgetItem(txt))
+                else:
+                    item.setText(txt)
 
-        # Make the table display all rows with no internal scrolling; the dialog scrolls instead
-        table.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        table.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         table.resizeColumnsToContents()
-        table.resizeRowsToContents()
         try:
-            total_h = table.horizontalHeader().height() + sum(table.rowHeight(r) for r in range(table.rowCount())) + 2
+            total_h = self.ROW_HEIGHT * table.rowCount() + table.horizontalHeader().height() + 2
             table.setMinimumHeight(total_h)
             table.setMaximumHeight(total_h)
         except Exception:
             pass
-        # Make the table display all rows with no internal scrolling; the dialog scrolls instead
-        table.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        table.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        table.resizeColumnsToContents()
-        table.resizeRowsToContents()
-        try:
-            total_h = table.horizontalHeader().height() + sum(table.rowHeight(r) for r in range(table.rowCount())) + 2
-            table.setMinimumHeight(total_h)
-            table.setMaximumHeight(total_h)
-        except Exception:
-            pass
-        # Disable internal scrolling so the outer dialog scrolls instead
-        table.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        table.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        table.resizeColumnsToContents()
-        table.resizeRowsToContents()
-        try:
-            t_height = table.horizontalHeader().height() + sum(table.rowHeight(r) for r in range(table.rowCount())) + 2
-            table.setMinimumHeight(t_height)
-            table.setMaximumHeight(t_height)
-        except Exception:
-            pass
-        v.addWidget(table)
-
-
-        btn_row = QHBoxLayout()
-        print_btn = QPushButton('Print')
-        export_btn = QPushButton('Export PDF')
-        close_btn = QPushButton('Close')
-        print_btn.clicked.connect(self.print_details)
-        export_btn.clicked.connect(self.export_details_pdf)
-        close_btn.clicked.connect(self.accept)
-        btn_row.addWidget(print_btn)
-        btn_row.addWidget(export_btn)
-        btn_row.addWidget(close_btn)
-        v.addLayout(btn_row)
-        # Shortcuts similar to main window
-        sc_print = QShortcut(QKeySequence.Print, self)
-        sc_print.activated.connect(self.print_details)
-        sc_export = QShortcut(QKeySequence('Ctrl+Shift+P'), self)
-        sc_export.activated.connect(self.export_details_pdf)
 
     def _details_html(self) -> str:
         # Header with names and overall percentage
@@ -351,7 +548,6 @@ class ViewNcoEntriesDialog(QDialog):
         cols = tbl.columnCount()
         rows = tbl.rowCount()
         headers = [(tbl.horizontalHeaderItem(c).text() if tbl.horizontalHeaderItem(c) else '') for c in range(cols)]
-        from PySide6.QtWidgets import QLabel, QProgressBar
         def cell_text(r: int, c: int) -> str:
             # Prefer widget contents
             w = tbl.cellWidget(r, c)
@@ -386,7 +582,7 @@ class ViewNcoEntriesDialog(QDialog):
             html.append('<tr>')
             for c in range(cols):
                 txt = cell_text(r, c)
-                txt = (txt or '').replace('&','&amp;').replace('<','&lt;').replace('>','&gt;')
+                txt = (txt or '').translate(_HTML_ESCAPE)
                 html.append(f'<td>{txt}</td>')
             html.append('</tr>')
         html.append('</table></body></html>')
@@ -403,13 +599,7 @@ class ViewNcoEntriesDialog(QDialog):
             return
         doc = QTextDocument()
         doc.setHtml(html)
-        try:
-            from PySide6.QtCore import QSizeF
-            paint = printer.pageLayout().paintRectPixels(printer.resolution())
-            doc.setPageSize(QSizeF(paint.size()))
-            doc.setTextWidth(paint.width())
-        except Exception:
-            pass
+        _apply_print_layout(doc, printer)
         doc.print_(printer)
 
     def _details_html(self) -> str:
@@ -421,7 +611,6 @@ class ViewNcoEntriesDialog(QDialog):
         cols = tbl.columnCount()
         rows = tbl.rowCount()
         headers = [(tbl.horizontalHeaderItem(c).text() if tbl.horizontalHeaderItem(c) else '') for c in range(cols)]
-        from PySide6.QtWidgets import QLabel, QProgressBar
         def cell_text(r: int, c: int) -> str:
             w = tbl.cellWidget(r, c)
             if w is not None:
@@ -455,7 +644,7 @@ class ViewNcoEntriesDialog(QDialog):
             html.append('<tr>')
             for c in range(cols):
                 txt = cell_text(r, c)
-                txt = (txt or '').replace('&','&amp;').replace('<','&lt;').replace('>','&gt;')
+                txt = (txt or '').translate(_HTML_ESCAPE)
                 html.append(f'<td>{txt}</td>')
             html.append('</tr>')
         html.append('</table></body></html>')
@@ -482,7 +671,6 @@ class ViewNcoEntriesDialog(QDialog):
             cols = tbl.columnCount()
             rows = tbl.rowCount()
             headers = [(tbl.horizontalHeaderItem(c).text() if tbl.horizontalHeaderItem(c) else '') for c in range(cols)]
-            from PySide6.QtWidgets import QLabel, QProgressBar
             def cell_text(r: int, c: int) -> str:
                 w = tbl.cellWidget(r, c)
                 if w is not None:
@@ -516,7 +704,7 @@ class ViewNcoEntriesDialog(QDialog):
                 html.append('<tr>')
                 for c in range(cols):
                     txt = cell_text(r, c)
-                    txt = (txt or '').replace('&','&amp;').replace('<','&lt;').replace('>','&gt;')
+                    txt = (txt or '').translate(_HTML_ESCAPE)
                     html.append(f'<td>{txt}</td>')
                 html.append('</tr>')
             html.append('</table></body></html>')
@@ -525,7 +713,6 @@ class ViewNcoEntriesDialog(QDialog):
             return ''
 
     def _export_details_pdf(self):
-        from PySide6.QtWidgets import QFileDialog
         html = self._details_html()
         if not html:
             return
@@ -539,13 +726,7 @@ class ViewNcoEntriesDialog(QDialog):
         printer.setOutputFileName(path)
         doc = QTextDocument()
         doc.setHtml(html)
-        try:
-            from PySide6.QtCore import QSizeF
-            paint = printer.pageLayout().paintRectPixels(printer.resolution())
-            doc.setPageSize(QSizeF(paint.size()))
-            doc.setTextWidth(paint.width())
-        except Exception:
-            pass
+        _apply_print_layout(doc, printer)
         doc.print_(printer)
 
 
@@ -563,7 +744,7 @@ class EditNcoEntryDialog(QDialog):
 
         # Competitor company selector
         self.company_combo = QComboBox()
-        self._companies = [c for c in self.db.list_companies('') if not c.get('is_ours')]
+        self._companies = self.db.list_competitor_companies()
         for c in self._companies:
             self.company_combo.addItem(c['name'], c['id'])
         form.addRow('Company', self.company_combo)
@@ -668,7 +849,7 @@ class EditMCUDialog(QDialog):
                 w = QLineEdit(str(val or ''))
             elif typ == 'int':
                 w = QLineEdit()
-                w.setValidator(QIntValidator(0, 100000, self))
+                w.setValidator(_int_validator())
                 try:
                     w.setText(str(int(val or 0)))
                 except Exception:
@@ -777,6 +958,10 @@ class DetailsDialog(QDialog):
         else:
             self.resize(1400, 950)
         self.setMinimumSize(1200, 850)
+        # Last generated print/export HTML as (signature, html)
+        self._html_cache = (None, '')
+        # Laid-out print document as [html, QTextDocument, page layout key]
+        self._doc_cache = None
         self._build_ui()
 
     # Public methods used in signal connections
@@ -794,19 +979,9 @@ class DetailsDialog(QDialog):
         dlg.setWindowTitle('Print Details')
         if dlg.exec() != QPrintDialog.Accepted:
             return
-        doc = QTextDocument()
-        doc.setHtml(html)
-        try:
-            from PySide6.QtCore import QSizeF
-            paint = printer.pageLayout().paintRectPixels(printer.resolution())
-            doc.setPageSize(QSizeF(paint.size()))
-            doc.setTextWidth(paint.width())
-        except Exception:
-            pass
-        doc.print_(printer)
+        self._print_document(html, printer).print_(printer)
 
     def export_details_pdf(self):
-        from PySide6.QtWidgets import QFileDialog
         html = _details_html_safe(self)
         if not html:
             return
@@ -815,23 +990,35 @@ class DetailsDialog(QDialog):
             return
         if not path.lower().endswith('.pdf'):
             path += '.pdf'
-        printer = QPrinter(QPrinter.HighResolution)
-        printer.setOutputFormat(QPrinter.PdfFormat)
-        printer.setOutputFileName(path)
-        try:
-            printer.setOrientation(QPrinter.Landscape)
-        except Exception:
-            pass
-        doc = QTextDocument()
-        doc.setHtml(html)
-        try:
-            from PySide6.QtCore import QSizeF
-            paint = printer.pageLayout().paintRectPixels(printer.resolution())
-            doc.setPageSize(QSizeF(paint.size()))
-            doc.setTextWidth(paint.width())
-        except Exception:
-            pass
-        doc.print_(printer)
+        # Render on the thread pool so layout of large tables doesn't freeze the UI
+        progress = QProgressDialog('Exporting PDF...', None, 0, 0, self)
+        progress.setWindowTitle('Export PDF')
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(0)
+        signals = _PdfExportSignals(self)
+        signals.finished.connect(lambda _path, error: self._on_pdf_exported(progress, signals, error))
+        progress.show()
+        QThreadPool.globalInstance().start(_PdfExportTask(html, path, signals))
+
+    def _on_pdf_exported(self, progress: QProgressDialog, signals: _PdfExportSignals, error: str):
+        progress.close()
+        progress.deleteLater()
+        signals.deleteLater()
+        if error:
+            QMessageBox.warning(self, 'Export PDF', f'Export failed: {error}')
+
+    def _print_document(self, html: str, printer) -> QTextDocument:
+        # Reuse the laid-out document across Print/Export while the HTML is unchanged;
+        # page geometry is only re-applied when the printer resolution or paint rect differs
+        cached = self._doc_cache
+        if cached is None or cached[0] != html:
+            doc = QTextDocument()
+            doc.setHtml(html)
+            cached = [html, doc, None]
+            self._doc_cache = cached
+        doc = cached[1]
+        cached[2] = _apply_print_layout(doc, printer, cached[2])
+        return doc
 
     def _build_ui(self):
         v = QVBoxLayout(self)
@@ -841,8 +1028,10 @@ class DetailsDialog(QDialog):
 
         feat_cols = self.db.feature_columns()
         # Include flags needed by business rules (is_dsp, is_fpga)
-        comp_feats = ({k: comp.get(k) for k in feat_cols}
-                      | {'name': comp.get('name', ''), 'is_dsp': comp.get('is_dsp'), 'is_fpga': comp.get('is_fpga')})
+        comp_feats = {k: comp.get(k) for k in feat_cols}
+        comp_feats['name'] = comp.get('name', '')
+        comp_feats['is_dsp'] = comp.get('is_dsp')
+        comp_feats['is_fpga'] = comp.get('is_fpga')
         our_feats = {k: ours.get(k) for k in feat_cols}
 
         overall, per_feat = weighted_similarity(comp_feats, our_feats)
@@ -860,13 +1049,8 @@ class DetailsDialog(QDialog):
         self.overall_bar.setRange(0, 100)
         self.overall_bar.setValue(int(round(overall)))
         self.overall_bar.setFormat(f"Overall Match: {overall:.1f}%")
-        # Update chunk color by category
-        self.overall_bar.setStyleSheet(
-            f"QProgressBar {{ font-size: 22px; font-weight: 700; padding: 2px; }}"
-            f" QProgressBar::chunk {{ background-color: {_cat_color(cat)}; }}"
-        )
         self.overall_bar.setTextVisible(True)
-        # Make percentage highly visible
+        # Make percentage highly visible; chunk color follows the category
         self.overall_bar.setStyleSheet(
             f"QProgressBar {{ font-size: 22px; font-weight: 700; padding: 2px; }}"
             f" QProgressBar::chunk {{ background-color: {_cat_color(cat)}; }}"
@@ -885,32 +1069,15 @@ class DetailsDialog(QDialog):
         top_tools.addWidget(btn_top_export)
         v.addLayout(top_tools)
 
-        # Compact donut chart (Match vs Gap)
-        series = QPieSeries()
-        match_val = max(0.0, min(100.0, overall))
-        gap_val = 100.0 - match_val
-        series.append('Match', match_val)
-        series.append('Gap', gap_val)
-        series.setHoleSize(0.55)
-        if series.slices():
-            s0 = series.slices()[0]
-            s0.setLabelVisible(False)
-            s0.setBrush(Qt.green)
-            s1 = series.slices()[1]
-            s1.setLabelVisible(False)
-            s1.setBrush(Qt.red)
-        chart = QChart()
-        chart.addSeries(series)
-        chart.legend().setVisible(False)
-        chart.setBackgroundVisible(False)
-        chart.setTitle("")
-        chart_view = QChartView(chart)
-        chart_view.setRenderHint(QPainter.Antialiasing)
+        # Compact donut chart (Match vs Gap) is built on first show; until then the
+        # overlay holds just the percentage label, so print/export never loads QtCharts
+        self._chart_match = max(0.0, min(100.0, overall))
+        self._chart_built = False
         self.overlay = QWidget()
         stack = QStackedLayout(self.overlay)
         stack.setContentsMargins(0, 0, 0, 0)
         stack.setStackingMode(QStackedLayout.StackingMode.StackAll)
-        stack.addWidget(chart_view)
+        self._overlay_stack = stack
         self.pct_label = QLabel(f"Overall Match: {overall:.1f}%")
         self.pct_label.setAlignment(Qt.AlignCenter)
         text_color = self.palette().color(QPalette.WindowText).name()
@@ -922,81 +1089,18 @@ class DetailsDialog(QDialog):
         )
         self.pct_label.setAttribute(Qt.WA_TransparentForMouseEvents, True)
         stack.addWidget(self.pct_label)
-        from PySide6.QtWidgets import QSizePolicy
         self.overlay.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        chart_view.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
         self.pct_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
         stack.setAlignment(self.pct_label, Qt.AlignCenter)
         self.overlay.setMinimumHeight(160)
         self.overlay.setMaximumHeight(180)
 
         # Prepare summary bullets data (will render AFTER the table)
-        def numeric(val):
-            try:
-                return float(val)
-            except Exception:
-                try:
-                    return int(val)
-                except Exception:
-                    return None
-
-        better: list[str] = []
-        worse: list[str] = []
-        more_is_better = {
-            'max_clock_mhz', 'flash_kb', 'sram_kb', 'gpios', 'uarts', 'spis', 'i2cs', 'pwms',
-            'timers', 'dacs', 'adcs', 'cans',
-            'output_compare', 'qspi', 'ext_interrupts'
-        }
-        # Booleans displayed as Yes/No (concise) — do not show 'vs'
-        bool_fields = {'eeprom', 'power_mgmt', 'clock_mgmt', 'qei', 'internal_osc', 'security_features'}
-        # Directional booleans (display only): treat as booleans for bullet text
-        bool_dir_display = {'input_capture', 'ethernet', 'emif', 'spi_slave'}
-        for key, label, typ in FEATURE_FIELDS:
-            c = comp_feats.get(key)
-            o = our_feats.get(key)
-            if key in more_is_better:
-                cn = numeric(c)
-                on = numeric(o)
-                if cn is None or on is None:
-                    continue
-                if on > cn:
-                    better.append(f"{label}: {on} vs {cn}")
-                elif on < cn:
-                    worse.append(f"{label}: {on} vs {cn}")
-            elif key in bool_fields or key in bool_dir_display:
-                try:
-                    cb = 1 if int(c or 0) == 1 else 0
-                except Exception:
-                    cb = 0
-                try:
-                    ob = 1 if int(o or 0) == 1 else 0
-                except Exception:
-                    ob = 0
-                if ob > cb:
-                    better.append(f"{label}: Yes")
-                elif ob < cb:
-                    worse.append(f"{label}: No")
-            elif key == 'fpu':
-                # Higher level is better: 0=None,1=Single,2=Double
-                try:
-                    cf = int(c or 0)
-                except Exception:
-                    cf = 0
-                try:
-                    of = int(o or 0)
-                except Exception:
-                    of = 0
-                names = {0: 'None', 1: 'Single precision', 2: 'Double precision'}
-                if of > cf:
-                    better.append(f"FPU: {names.get(of, of)} vs {names.get(cf, cf)}")
-                elif of < cf:
-                    worse.append(f"FPU: {names.get(of, of)} vs {names.get(cf, cf)}")
-            # Skip textual cores and optional alt core in bullets
+        better, worse = self._compute_bullets(comp_feats, our_feats)
 
         # Two-column content row: [Main table] [Right sidebar with donut + panels]
         content_row = QHBoxLayout()
         content_row.setContentsMargins(0, 0, 0, 0)
-        from PySide6.QtWidgets import QFrame
         # Main area: table only at top-left
         center_col = QVBoxLayout()
         center_col.setContentsMargins(0, 0, 0, 0)
@@ -1006,7 +1110,6 @@ class DetailsDialog(QDialog):
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         center_col.addWidget(self.table)
         # Context menu on table for print/export
-        from PySide6.QtWidgets import QMenu
         def _open_table_menu(pos):
             menu = QMenu(self)
             act_print = menu.addAction('Print...')
@@ -1025,50 +1128,22 @@ class DetailsDialog(QDialog):
         self._right_box.setSpacing(8)
         # Add donut overlay at the top of the sidebar
         self._right_box.addWidget(self.overlay)
-        # Helper to build a panel
-        def _mk_panel(html: str, ok: bool) -> QFrame:
+        # Helper to build a bullet panel
+        def _mk_panel(items: list, ok: bool) -> QFrame:
             frame = QFrame()
             frame.setFrameShape(QFrame.StyledPanel)
-            frame.setStyleSheet(
-                "QFrame { background: rgba(46, 125, 50, 0.10); border: 1px solid rgba(46,125,50,0.35); border-radius: 6px; padding: 6px; }"
-                if ok else
-                "QFrame { background: rgba(198, 40, 40, 0.10); border: 1px solid rgba(198,40,40,0.35); border-radius: 6px; padding: 6px; }"
-            )
-            lbl = QLabel(html)
+            frame.setStyleSheet(_PANEL_OK_QSS if ok else _PANEL_BAD_QSS)
+            lbl = QLabel(_panel_html(items, ok))
             lbl.setWordWrap(True)
             lay = QVBoxLayout(frame)
             lay.setContentsMargins(6,6,6,6)
             lay.addWidget(lbl)
             return frame
-        # Populate initial panels
+        # Panels only for sides that have bullets
         if better:
-            better_html = """
-            <div style='font-size:14px; line-height:1.35;'>
-              <div style='font-weight:700; font-size:15px; color:#2e7d32; margin-bottom:6px;'>Areas OUR MCU is better</div>
-              <ul style='list-style:none; margin:0; padding:0;'>
-            """ + "".join(
-                f"<li><span style='color:#2e7d32; font-weight:700; margin-right:8px;'>✔</span>{item}</li>"
-                for item in better
-            ) + """
-              </ul>
-            </div>
-            """
-            self._frame_better = _mk_panel(better_html, True)
-            self._right_box.addWidget(self._frame_better)
+            self._right_box.addWidget(_mk_panel(better, True))
         if worse:
-            worse_html = """
-            <div style='font-size:14px; line-height:1.35;'>
-              <div style='font-weight:700; font-size:15px; color:#ffffff; margin-bottom:6px;'>Areas OUR MCU lacks</div>
-              <ul style='list-style:none; margin:0; padding:0;'>
-            """ + "".join(
-                f"<li><span style='color:#ef5350; font-weight:700; margin-right:8px;'>✖</span>{item}</li>"
-                for item in worse
-            ) + """
-              </ul>
-            </div>
-            """
-            self._frame_worse = _mk_panel(worse_html, False)
-            self._right_box.addWidget(self._frame_worse)
+            self._right_box.addWidget(_mk_panel(worse, False))
         # Keep sidebar content aligned to the top
         self._right_box.addStretch(1)
         # Assemble row: give the table most space
@@ -1076,40 +1151,21 @@ class DetailsDialog(QDialog):
         content_row.addWidget(right_host, 1)
         v.addLayout(content_row)
 
-        from mcu_compare.engine.similarity import DEFAULT_WEIGHTS
-        # Keep references we need for live updates
-        self._comp_feats = comp_feats
-        self._our_feats = our_feats
-        self._per_feat = per_feat
-        self._sim_bars = {}
+        self.table.setItemDelegateForColumn(3, ProgressDelegate(self.table))
         for row, (key, label, typ) in enumerate(FEATURE_FIELDS):
             self.table.setItem(row, 0, QTableWidgetItem(label))
-            # Boolean formatting as Yes/No
-            def fmt(val):
-                if typ == 'bool':
-                    return 'Yes' if int(val or 0) == 1 else 'No'
-                if key == 'fpu':
-                    mapping = {0: 'None', 1: 'Single precision', 2: 'Double precision'}
-                    try:
-                        return mapping.get(int(val), str(val))
-                    except Exception:
-                        return str(val)
-                return str(val)
-            item_comp = QTableWidgetItem(fmt(comp.get(key, '')))
+            item_comp = QTableWidgetItem(_fmt_feature(key, typ, comp.get(key, '')))
             item_comp.setFlags(item_comp.flags() & ~Qt.ItemIsEditable)
             self.table.setItem(row, 1, item_comp)
-            item_our = QTableWidgetItem(fmt(ours.get(key, '')))
+            item_our = QTableWidgetItem(_fmt_feature(key, typ, ours.get(key, '')))
             # Make OUR MCU column read-only per requirements
             item_our.setFlags(item_our.flags() & ~Qt.ItemIsEditable)
             self.table.setItem(row, 2, item_our)
             sim = per_feat.get(key, 0.0) * 100.0
-            sim_bar = QProgressBar()
-            sim_bar.setRange(0, 100)
-            sim_bar.setValue(int(round(sim)))
-            sim_bar.setFormat(f"{sim:.0f}%")
-            sim_bar.setTextVisible(True)
-            self.table.setCellWidget(row, 3, sim_bar)
-            self._sim_bars[key] = sim_bar
+            sim_item = QTableWidgetItem(f"{sim:.0f}%")
+            sim_item.setData(Qt.UserRole, sim)
+            sim_item.setFlags(sim_item.flags() & ~Qt.ItemIsEditable)
+            self.table.setItem(row, 3, sim_item)
         # Table is read-only; no inline edits
 
         btn_row = QHBoxLayout()
@@ -1118,152 +1174,68 @@ class DetailsDialog(QDialog):
         btn_row.addWidget(close_btn)
         v.addLayout(btn_row)
 
-    def _on_table_item_changed(self, item: QTableWidgetItem):
-        # Only handle edits in OUR MCU column
-        if item.column() != 2:
-            return
-        row = item.row()
-        if row < 0 or row >= len(FEATURE_FIELDS):
-            return
-        key, label, typ = FEATURE_FIELDS[row]
-        # Only numeric fields are editable
-        if typ not in ('int', 'float'):
-            return
-        text = item.text().strip()
-        # Parse value
-        try:
-            if typ == 'int':
-                val = int(float(text or '0'))
-            else:
-                val = float(text or '0')
-        except Exception:
-            # Revert display to previous value
-            prev = self._our_feats.get(key, 0)
-            item.setText(str(prev))
-            return
-        # Persist to DB and local cache
-        if self.db.update_mcu(self.our_mcu_id, {key: val}):
-            self._our_feats[key] = val
-            self._recompute_and_refresh()
-
-    def _recompute_and_refresh(self):
-        # Recompute similarity and update UI pieces
-        overall, per_feat = weighted_similarity(self._comp_feats, self._our_feats)
-        self._per_feat = per_feat
-        cat = categorize(overall)
-        def _cat_color(c: str) -> str:
-            return {'Best Match': '#2e7d32', 'Partial': '#f9a825', 'No Match': '#c62828'}.get(c, '#2e7d32')
-        # Header and bars
-        self.header.setText(f"{self._comp_feats.get('name','')} vs {self.db.get_mcu_by_id(self.our_mcu_id)['name']} — Match {overall:.1f}% ({cat})")
-        self.overall_bar.setValue(int(round(overall)))
-        self.overall_bar.setFormat(f"Overall Match: {overall:.1f}%")
-        self.pct_label.setText(f"Overall Match: {overall:.1f}%")
-        # Update per-row progress bars
-        for (key, _, _typ) in FEATURE_FIELDS:
-            bar = self._sim_bars.get(key)
-            if bar is not None:
-                sim = per_feat.get(key, 0.0) * 100.0
-                bar.setValue(int(round(sim)))
-                bar.setFormat(f"{sim:.0f}%")
-        # Recompute bullets
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._chart_built:
+            self._build_chart()
+
+    def _build_chart(self):
+        from PySide6.QtCharts import QChart, QChartView, QPieSeries
+        self._chart_built = True
+        series = QPieSeries()
+        match_val = self._chart_match
+        gap_val = 100.0 - match_val
+        series.append('Match', match_val)
+        series.append('Gap', gap_val)
+        series.setHoleSize(0.55)
+        if series.slices():
+            s0 = series.slices()[0]
+            s0.setLabelVisible(False)
+            s0.setBrush(Qt.green)
+            s1 = series.slices()[1]
+            s1.setLabelVisible(False)
+            s1.setBrush(Qt.red)
+        chart = QChart()
+        chart.addSeries(series)
+        chart.legend().setVisible(False)
+        chart.setBackgroundVisible(False)
+        chart.setTitle("")
+        chart_view = QChartView(chart)
+        chart_view.setRenderHint(QPainter.Antialiasing)
+        chart_view.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        # Chart goes underneath the label, and is the current widget as when built eagerly
+        self._overlay_stack.insertWidget(0, chart_view)
+        self._overlay_stack.setCurrentWidget(chart_view)
+
+    def _compute_bullets(self, comp_feats: Dict[str, Any], our_feats: Dict[str, Any]):
+        # Returns (better, worse) bullet texts for the sidebar panels
         better: list[str] = []
         worse: list[str] = []
-        def numeric(val):
-            try:
-                return float(val)
-            except Exception:
-                try:
-                    return int(val)
-                except Exception:
-                    return None
-        more_is_better = {
-            'max_clock_mhz', 'flash_kb', 'sram_kb', 'gpios', 'uarts', 'spis', 'i2cs', 'pwms',
-            'timers', 'dacs', 'adcs', 'cans',
-            'output_compare', 'qspi', 'ext_interrupts'
-        }
-        bool_fields = {'eeprom', 'power_mgmt', 'clock_mgmt', 'qei', 'internal_osc', 'security_features'}
-        bool_dir_display = {'input_capture', 'ethernet', 'emif', 'spi_slave'}
-        for key, label, typ in FEATURE_FIELDS:
-            c = self._comp_feats.get(key)
-            o = self._our_feats.get(key)
-            if key in more_is_better:
-                cn = numeric(c)
-                on = numeric(o)
+        for key, label, kind in _FIELD_KIND:
+            c = comp_feats.get(key)
+            o = our_feats.get(key)
+            if kind == 'more':
+                cn = _numeric(c)
+                on = _numeric(o)
                 if cn is None or on is None:
                     continue
                 if on > cn:
                     better.append(f"{label}: {on} vs {cn}")
                 elif on < cn:
                     worse.append(f"{label}: {on} vs {cn}")
-            elif key in bool_fields or key in bool_dir_display:
-                try:
-                    cb = 1 if int(c or 0) == 1 else 0
-                except Exception:
-                    cb = 0
-                try:
-                    ob = 1 if int(o or 0) == 1 else 0
-                except Exception:
-                    ob = 0
+            elif kind == 'bool':
+                cb = _to_bool(c)
+                ob = _to_bool(o)
                 if ob > cb:
                     better.append(f"{label}: Yes")
                 elif ob < cb:
                     worse.append(f"{label}: No")
-            elif key == 'fpu':
-                try:
-                    cf = int(c or 0)
-                except Exception:
-                    cf = 0
-                try:
-                    of = int(o or 0)
-                except Exception:
-                    of = 0
-                names = {0: 'None', 1: 'Single precision', 2: 'Double precision'}
+            else:
+                # FPU: higher level is better (0=None, 1=Single, 2=Double)
+                cf = _to_int(c)
+                of = _to_int(o)
                 if of > cf:
-                    better.append(f"FPU: {names.get(of, of)} vs {names.get(cf, cf)}")
+                    better.append(f"FPU: {_FPU_NAMES.get(of, of)} vs {_FPU_NAMES.get(cf, cf)}")
                 elif of < cf:
-                    worse.append(f"FPU: {names.get(of, of)} vs {names.get(cf, cf)}")
-        # Rebuild sidebar frames
-        from PySide6.QtWidgets import QFrame
-        # Clear existing items in the sidebar layout
-        if hasattr(self, '_side_layout') and self._side_layout is not None:
-            while self._side_layout.count():
-                w = self._side_layout.takeAt(0).widget()
-                if w is not None:
-                    w.setParent(None)
-        # Add again if non-empty
-        if better:
-            better_html = """
-            <div style='font-size:12px;'>
-              <div style='font-weight:600; color:#2e7d32; margin-bottom:4px;'>Areas OUR MCU is better</div>
-              <ul style='margin:0 0 0 16px; padding:0;'>
-            """ + "".join(f"<li>{item}</li>" for item in better) + """
-              </ul>
-            </div>
-            """
-            frame_better = QFrame()
-            frame_better.setFrameShape(QFrame.StyledPanel)
-            frame_better.setStyleSheet("QFrame { background: rgba(46, 125, 50, 0.10); border: 1px solid rgba(46,125,50,0.35); border-radius: 6px; padding: 6px; }")
-            lbl_better = QLabel(better_html)
-            lbl_better.setWordWrap(True)
-            fb = QVBoxLayout(frame_better)
-            fb.setContentsMargins(6,6,6,6)
-            fb.addWidget(lbl_better)
-            self._side_layout.addWidget(frame_better)
-        if worse:
-            worse_html = """
-            <div style='font-size:12px;'>
-              <div style='font-weight:600; color:#c62828; margin-bottom:4px;'>Areas OUR MCU lacks</div>
-              <ul style='margin:0 0 0 16px; padding:0;'>
-            """ + "".join(f"<li>{item}</li>" for item in worse) + """
-              </ul>
-            </div>
-            """
-            frame_worse = QFrame()
-            frame_worse.setFrameShape(QFrame.StyledPanel)
-            frame_worse.setStyleSheet("QFrame { background: rgba(198, 40, 40, 0.10); border: 1px solid rgba(198,40,40,0.35); border-radius: 6px; padding: 6px; }")
-            lbl_worse = QLabel(worse_html)
-            lbl_worse.setWordWrap(True)
-            fw = QVBoxLayout(frame_worse)
-            fw.setContentsMargins(6,6,6,6)
-            fw.addWidget(lbl_worse)
-            self._side_layout.addWidget(frame_worse)
+                    worse.append(f"FPU: {_FPU_NAMES.get(of, of)} vs {_FPU_NAMES.get(cf, cf)}")
+        return better, worse
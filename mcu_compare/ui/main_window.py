@@ -1,22 +1,27 @@
 from typing import List, Dict, Any
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QComboBox,
-    QTableWidget, QTableWidgetItem, QPushButton, QHeaderView, QMessageBox, QTabWidget
+    QTableWidget, QTableWidgetItem, QTableView, QPushButton, QHeaderView, QMessageBox, QTabWidget,
+    QStyledItemDelegate, QStyleOptionViewItem, QStyleOptionToolButton, QStyle, QToolButton, QToolTip
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer, QAbstractTableModel, QModelIndex, QEvent, QObject, QRunnable, QThreadPool, Signal
 from PySide6.QtWidgets import QApplication
 import webbrowser
 import os
-from PySide6.QtGui import QColor, QBrush, QAction, QActionGroup, QIcon, QCursor, QKeySequence, QPainter, QPixmap, QPdfWriter, QPageLayout, QPageSize, QImage, QTextDocument
+import re
+import json
+import hashlib
+from collections import Counter
+from PySide6.QtGui import QStandardItemModel, QStandardItem
+from PySide6.QtGui import QColor, QBrush, QAction, QActionGroup, QIcon, QCursor, QKeySequence, QPainter, QPixmap, QPixmapCache, QPdfWriter, QPageLayout, QPageSize, QTextDocument
 from PySide6.QtCore import QRect, QPoint, QItemSelectionModel
-from PySide6.QtGui import QRegion
 from PySide6.QtCore import QSize
-from PySide6.QtWidgets import QAbstractItemView, QSizePolicy, QFileDialog
+from PySide6.QtWidgets import QAbstractItemView, QFileDialog
 from PySide6.QtPrintSupport import QPrinter, QPrintDialog
 
-from mcu_compare.engine.similarity import best_match, categorize
+from mcu_compare.engine.similarity import best_match, categorize, prepare_candidates, DEFAULT_WEIGHTS, SCORING_VERSION
 from mcu_compare.engine.similarity import weighted_similarity
-from .dialogs import AddMCUDialog, DetailsDialog, AddCompanyDialog, AddNcoEntryDialog, ViewNcoEntriesDialog, EditNcoEntryDialog, EditMCUDialog
+from .dialogs import AddMCUDialog, DetailsDialog, AddCompanyDialog, AddNcoEntryDialog, ViewNcoEntriesDialog, EditNcoEntryDialog, EditMCUDialog, _HTML_ESCAPE
 
 
 CATEGORY_COLORS = {
@@ -26,6 +31,388 @@ CATEGORY_COLORS = {
 }
 
 
+# Category chip colours as shared brushes; higher rank sorts first when descending
+CATEGORY_BRUSHES = {k: QBrush(QColor(v)) for k, v in CATEGORY_COLORS.items()}
+_DEFAULT_CATEGORY_BRUSH = QBrush(QColor('#444'))
+_CHIP_TEXT_BRUSH = QBrush(QColor('white'))
+_CATEGORY_ORDER = {'Best Match': 2, 'Partial': 1, 'No Match': 0}
+
+
+class _CategoryItem(QTableWidgetItem):
+    """Category cell painted as a coloured chip, sorted by match rank instead of text."""
+
+    def __init__(self, category: str):
+        super().__init__(category)
+        self.setData(Qt.UserRole, _CATEGORY_ORDER.get(category, -1))
+        self.setTextAlignment(Qt.AlignCenter)
+        self.setBackground(CATEGORY_BRUSHES.get(category, _DEFAULT_CATEGORY_BRUSH))
+        self.setForeground(_CHIP_TEXT_BRUSH)
+
+    def __lt__(self, other):
+        if isinstance(other, _CategoryItem):
+            return self.data(Qt.UserRole) < other.data(Qt.UserRole)
+        return super().__lt__(other)
+
+
+# Pill look of the per-row "PDF" datasheet button
+_PDF_BUTTON_QSS = (
+    "QToolButton {"
+    "  padding: 2px 8px;"
+    "  border: 1px solid #3a6cf4;"
+    "  border-radius: 11px;"
+    "  background-color: rgba(58,108,244,0.15);"
+    "  color: #ffffff;"
+    "  font-weight: 600;"
+    "}"
+    "QToolButton:hover {"
+    "  background-color: rgba(58,108,244,0.28);"
+    "  border-color: #5e86f7;"
+    "}"
+    "QToolButton:pressed {"
+    "  background-color: rgba(58,108,244,0.40);"
+    "  border-color: #86a3fb;"
+    "}"
+)
+
+
+class CompareTableModel(QAbstractTableModel):
+    """Compare tab rows held as plain tuples; the view only asks for what it paints.
+
+    Row layout: (manufacturer, part_name, mcu_id, match_name, match_id, match_pct, category).
+    Rows are exposed to the view in FETCH_BATCH chunks via canFetchMore/fetchMore."""
+
+    HEADERS = ['Manufacturer', 'Part NO', 'Compatibility', 'Match %', 'Category']
+    FETCH_BATCH = 200
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        # Leading rows of _rows the view has been told about
+        self._loaded = 0
+        # Column/order last requested by the view; reapplied whenever rows are replaced
+        self._sort_column = -1
+        self._sort_order = Qt.AscendingOrder
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        r = self._rows[index.row()]
+        col = index.column()
+        if role == Qt.DisplayRole:
+            if col == 0:
+                return r[0]
+            if col == 1:
+                return r[1]
+            if col == 2:
+                return r[3] if r[3] is not None else '-'
+            if col == 3:
+                # Same text the previous float-valued table item showed; sorting uses the number
+                return str(r[5])
+            if col == 4:
+                return r[6]
+        elif role == Qt.UserRole:
+            if col == 1:
+                return r[2]
+            if col == 2:
+                return r[4]
+        elif role == Qt.TextAlignmentRole:
+            if col >= 3:
+                return int(Qt.AlignCenter)
+        elif role == Qt.BackgroundRole:
+            if col == 4:
+                return CATEGORY_BRUSHES.get(r[6], _DEFAULT_CATEGORY_BRUSH)
+        elif role == Qt.ForegroundRole:
+            if col == 4:
+                return _CHIP_TEXT_BRUSH
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loaded < len(self._rows)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        n = min(self.FETCH_BATCH, len(self._rows) - self._loaded)
+        if n <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + n - 1)
+        self._loaded += n
+        self.endInsertRows()
+
+    def row_record(self, row: int):
+        if 0 <= row < self._loaded:
+            return self._rows[row]
+        return None
+
+    def set_rows(self, rows):
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._sort_rows()
+        self._loaded = min(self.FETCH_BATCH, len(self._rows))
+        self.endResetModel()
+
+    @staticmethod
+    def _sort_key(column: int):
+        if column == 2:
+            return lambda r: r[3] if r[3] is not None else '-'
+        if column == 4:
+            return lambda r: _CATEGORY_ORDER.get(r[6], -1)
+        return lambda r: r[(0, 1, None, 5)[column]]
+
+    def _sort_rows(self):
+        if 0 <= self._sort_column < len(self.HEADERS):
+            # Stable, like QTableWidget sorting: equal keys keep their fetch order
+            self._rows.sort(key=self._sort_key(self._sort_column), reverse=(self._sort_order == Qt.DescendingOrder))
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self._sort_column = column
+        self._sort_order = order
+        self.layoutAboutToBeChanged.emit()
+        # _sort_rows sorts in place; keep the old order to remap indexes from
+        old_rows = list(self._rows)
+        self._sort_rows()
+        # Keep selection/current index on the same records after reordering;
+        # records sorted past the fetched rows drop out of the selection
+        new_pos = {id(r): i for i, r in enumerate(self._rows)}
+        old_idx = self.persistentIndexList()
+        new_idx = []
+        for i in old_idx:
+            pos = new_pos[id(old_rows[i.row()])]
+            new_idx.append(self.index(pos, i.column()) if pos < self._loaded else QModelIndex())
+        self.changePersistentIndexList(old_idx, new_idx)
+        self.layoutChanged.emit()
+
+
+class PdfButtonDelegate(QStyledItemDelegate):
+    """Paints a "PDF" pill in front of the cell text and reports clicks on it.
+
+    Replaces a QWidget + QToolButton + QLabel per row; on_click receives the cell's display text."""
+
+    def __init__(self, on_click, parent=None):
+        super().__init__(parent)
+        self._on_click = on_click
+        # Hidden button as the style target so the pill stylesheet (incl. hover/pressed) applies
+        self._btn = QToolButton(parent)
+        self._btn.setText('PDF')
+        self._btn.setStyleSheet(_PDF_BUTTON_QSS)
+        self._btn.hide()
+        self._btn_size = None
+        self._hover = None
+        self._pressed = None
+        # The view emits doubleClicked before consulting the delegate, so pill double-clicks
+        # are dropped at the viewport instead
+        if isinstance(parent, QAbstractItemView):
+            parent.viewport().installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.MouseButtonDblClick:
+            view = self.parent()
+            pos = event.position().toPoint()
+            index = view.indexAt(pos)
+            if (index.isValid() and view.itemDelegateForIndex(index) is self
+                    and self._button_rect(view.visualRect(index)).contains(pos)):
+                return True
+        return super().eventFilter(obj, event)
+
+    def _button_rect(self, rect: QRect) -> QRect:
+        if self._btn_size is None:
+            self._btn.ensurePolished()
+            self._btn_size = QSize(max(40, self._btn.sizeHint().width()), 22)
+        w, h = self._btn_size.width(), self._btn_size.height()
+        return QRect(rect.x() + 4, rect.y() + (rect.height() - h) // 2, w, h)
+
+    def paint(self, painter, option, index):
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        widget = opt.widget
+        style = widget.style() if widget is not None else QApplication.style()
+        text = opt.text
+        # Background/selection for the whole cell, then the pill, then the name beside it
+        opt.text = ''
+        style.drawControl(QStyle.CE_ItemViewItem, opt, painter, widget)
+        btn_rect = self._button_rect(option.rect)
+        key = (index.row(), index.column())
+        hover = self._hover == key and bool(option.state & QStyle.State_MouseOver)
+        pressed = self._pressed == key
+        painter.drawPixmap(btn_rect.topLeft(), self._pill_pixmap(hover, pressed, painter.device().devicePixelRatioF()))
+        opt.text = text
+        opt.rect = option.rect.adjusted(btn_rect.right() + 1 - option.rect.x(), 0, 0, 0)
+        style.drawControl(QStyle.CE_ItemViewItem, opt, painter, widget)
+
+    def _pill_pixmap(self, hover: bool, pressed: bool, dpr: float) -> QPixmap:
+        # The pill looks the same in every row, so each state is styled once and reused from
+        # QPixmapCache; MainWindow._set_theme clears the cache when the stylesheet changes
+        size = self._btn_size
+        cache_key = f'mcu_compare_pdf_pill_{int(hover)}{int(pressed)}_{size.width()}x{size.height()}@{dpr}'
+        pm = QPixmapCache.find(cache_key)
+        if pm is not None:
+            return pm
+        bopt = QStyleOptionToolButton()
+        bopt.initFrom(self._btn)
+        bopt.rect = QRect(QPoint(0, 0), size)
+        bopt.text = 'PDF'
+        bopt.toolButtonStyle = Qt.ToolButtonTextOnly
+        bopt.subControls = QStyle.SC_ToolButton
+        bopt.state = QStyle.State_Enabled | QStyle.State_AutoRaise
+        if hover:
+            bopt.state |= QStyle.State_MouseOver | QStyle.State_Raised
+        if pressed:
+            bopt.state |= QStyle.State_Sunken
+            bopt.activeSubControls = QStyle.SC_ToolButton
+        pm = QPixmap(round(size.width() * dpr), round(size.height() * dpr))
+        pm.setDevicePixelRatio(dpr)
+        pm.fill(Qt.transparent)
+        p = QPainter(pm)
+        try:
+            self._btn.style().drawComplexControl(QStyle.CC_ToolButton, bopt, p, self._btn)
+        finally:
+            p.end()
+        QPixmapCache.insert(cache_key, pm)
+        return pm
+
+    def editorEvent(self, event, model, option, index):
+        et = event.type()
+        if et not in (QEvent.MouseMove, QEvent.MouseButtonPress, QEvent.MouseButtonRelease, QEvent.MouseButtonDblClick):
+            return super().editorEvent(event, model, option, index)
+        inside = self._button_rect(option.rect).contains(event.position().toPoint())
+        key = (index.row(), index.column())
+        view = option.widget
+        if et == QEvent.MouseMove:
+            hover = key if inside else None
+            if hover != self._hover:
+                self._hover = hover
+                if view is not None:
+                    if inside:
+                        view.viewport().setCursor(QCursor(Qt.PointingHandCursor))
+                    else:
+                        view.viewport().unsetCursor()
+                    view.viewport().update()
+            return False
+        if event.button() != Qt.LeftButton or not inside:
+            return False
+        if et == QEvent.MouseButtonPress:
+            self._pressed = key
+        elif et == QEvent.MouseButtonRelease:
+            clicked = self._pressed == key
+            self._pressed = None
+            if clicked:
+                self._on_click(index.data(Qt.DisplayRole) or '')
+        if view is not None:
+            view.viewport().update()
+        # Swallow clicks on the pill so they don't select the row or open details
+        return True
+
+    def helpEvent(self, event, view, option, index):
+        if event.type() == QEvent.ToolTip and self._button_rect(option.rect).contains(event.pos()):
+            QToolTip.showText(event.globalPos(), 'Open datasheet (local)', view)
+            return True
+        return super().helpEvent(event, view, option, index)
+
+
+# Upper bound on memoized similarity results before the cache is dropped and rebuilt
+_SCORE_CACHE_MAX = 4096
+
+# Cache misses up to this many are scored inline; larger batches go to the thread pool
+_INLINE_SCORE_MAX = 32
+
+# Compare and NCO table scores are kept across restarts as score_cache_{data hash}.json in this folder
+_SCORE_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.mcu_compare')
+
+
+def _score_target(mcu: Dict[str, Any], feat_cols) -> Dict[str, Any]:
+    # Competitor side of a score: feature values plus the fields the similarity rules read (name, DSP/FPGA flags)
+    target = {k: mcu.get(k) for k in feat_cols}
+    target['name'] = mcu.get('name', '')
+    target['is_dsp'] = mcu.get('is_dsp')
+    target['is_fpga'] = mcu.get('is_fpga')
+    return target
+
+
+def _score_candidate(mcu: Dict[str, Any], feat_cols) -> Dict[str, Any]:
+    # OUR side of best_match: feature values plus the id/name the result is reported by
+    cand = {k: mcu.get(k) for k in feat_cols}
+    cand['id'] = mcu['id']
+    cand['name'] = mcu['name']
+    return cand
+
+
+def _score_jobs(jobs, candidates, columns):
+    """Score (key, target, our_feats, fixed_best) jobs into [(key, best, score)].
+    our_feats None means best match over candidates. Touches no widgets, so it may run off the GUI thread."""
+    out = []
+    for key, target, our_feats, fixed_best in jobs:
+        if our_feats is None:
+            best, score, _ = best_match(target, candidates, columns=columns)
+        else:
+            score, _ = weighted_similarity(target, our_feats)
+            best = fixed_best
+        out.append((key, best, score))
+    return out
+
+
+class _ScoreSignals(QObject):
+    # (table, token, cache version, results or None on failure) once a background batch is scored
+    finished = Signal(str, int, int, object)
+
+
+class _ScoreTask(QRunnable):
+    # Runs _score_jobs on the global thread pool and reports back through _ScoreSignals
+    def __init__(self, table: str, token: int, version: int, jobs, candidates, columns, signals: _ScoreSignals):
+        super().__init__()
+        self.table = table
+        self.token = token
+        self.version = version
+        self.jobs = jobs
+        self.candidates = candidates
+        self.columns = columns
+        self.signals = signals
+
+    def run(self):
+        try:
+            results = _score_jobs(self.jobs, self.candidates, self.columns)
+        except Exception:
+            results = None
+        try:
+            self.signals.finished.emit(self.table, self.token, self.version, results)
+        except RuntimeError:
+            # Window already gone
+            pass
+
+
+# Strips everything but lowercase letters/digits for punctuation-insensitive MCU name search
+_NAME_NORM_RE = re.compile(r"[^a-z0-9]")
+
+
+# Datasheet lookup: file stems and MCU names compared with punctuation stripped;
+# a name without '-' is cut at its first space or '('
+_DATASHEET_KEY_RE = re.compile(r'[^a-z0-9]+')
+_DATASHEET_BASE_SPLIT_RE = re.compile(r'\s|\(')
+# Byte values to delete so only a-z/0-9 survive; matches _DATASHEET_KEY_RE on ASCII text
+_DATASHEET_KEY_DROP = bytes(b for b in range(256) if not (0x61 <= b <= 0x7a or 0x30 <= b <= 0x39))
+
+
+def _datasheet_key(text: str) -> str:
+    # Lowercase a-z/0-9 only; plain ASCII names go through one bytes.translate pass
+    t = text.lower()
+    if t.isascii():
+        # Bare stems like 'stm32f103' are already normalized
+        if t.isalnum():
+            return t
+        return t.encode('ascii').translate(None, _DATASHEET_KEY_DROP).decode('ascii')
+    return _DATASHEET_KEY_RE.sub('', t)
+
+
 class MainWindow(QMainWindow):
     def __init__(self, db):
         super().__init__()
@@ -33,6 +420,69 @@ class MainWindow(QMainWindow):
         self.setWindowTitle('StriveFit')
         self.resize(1400, 900)
         self.setMinimumSize(1200, 800)
+        # Reused across "View Entries" opens; refreshed in place
+        self._nco_view_dialog = None
+        # Details dialog currently open, if any; File->Print/Export target it instead of a table
+        self._details_dialog = None
+        # NCO entries shown in the NCO table, by id; rebuilt on every NCO refresh
+        self._nco_entries_by_id = {}
+        # Theme -> ((path, mtime_ns), stylesheet text); reloaded when the file changes
+        self._qss_cache = {}
+        # Widgets read by refresh slots; None until _build_ui creates them
+        self.search_edit = None
+        self.nco_table = None
+        self.nco_panel = None
+        self.nco_org_combo = None
+        self.nco_search = None
+        self.nco_search_mode = None
+        # Query results reused across refreshes; cleared by _invalidate_caches() after edits
+        self._companies_cache = None
+        self._companies_map = None
+        self._competitors_lc_cache = None
+        self._our_mcus_cache = None
+        self._feat_cols_cache = None
+        # OUR MCUs as best_match candidates plus their prepared feature columns
+        self._candidates_cache = None
+        # Competitor MCU rows per scope (company id, or None for all) -> (rows, normalized names)
+        self._mcu_rows_cache = {}
+        # Last MCU-mode search: (rows cache entry it filtered, normalized query, matching rows, their names)
+        self._mcu_search_cache = None
+        # (competitor company name, MCU name) -> MCU id, for re-resolving colliding ids in details
+        self._competitor_ids_cache = None
+        # Similarity results keyed by (company_id, mcu_id, our_id or None) -> (best, score);
+        # MCU features only change through edits, which bump the version and clear these
+        self._our_mcus_version = 0
+        self._score_cache = {}
+        self._nco_score_cache = {}
+        # Background scoring: latest batch token per table; older batches only warm the cache
+        self._score_tokens = {'compare': 0, 'nco': 0}
+        # Keys handed to the thread pool and not back yet -> token of their batch; never queued twice
+        self._score_pending = {'compare': {}, 'nco': {}}
+        # Tables whose latest refresh also waits on keys queued by an earlier batch
+        self._score_waiting = set()
+        self._nco_scores_landed = False
+        self._score_signals = _ScoreSignals(self)
+        self._score_signals.finished.connect(self._on_scores_ready)
+        # Inputs of the last rendered compare table; unchanged inputs skip the re-render
+        self._last_refresh_sig = None
+        self._force_refresh = False
+        # Tabs (0 = Compare, 1 = NCO) whose refresh was requested while hidden; run when shown
+        self._stale_tabs = set()
+        # Tab the widget/action toggles were last applied for; -1 until _build_ui applies them
+        self._last_tab_index = -1
+        # Company filter the company dropdown was last built with; None until first built
+        self._company_search = None
+        # Datasheet folder index, rebuilt when the folder's mtime changes:
+        # normalized stem -> (listing position, path) for the first PDF with that stem, and
+        # (normalized stem, path) for every PDF in listing order for substring matches
+        self._ds_cache_mtime = None
+        self._ds_exact = {}
+        self._ds_keys = []
+        # MCU name -> (base key, full key); names never change meaning, so this is never cleared
+        self._ds_name_keys = {}
+        # Score cache file this window last read or wrote; only that one is replaced on save
+        self._score_cache_path = None
+        self._load_score_cache()
         self._build_ui()
         self._load_companies()
         self._refresh_table()
@@ -116,11 +566,20 @@ class MainWindow(QMainWindow):
         act_dark.triggered.connect(lambda: self._set_theme('Dark'))
         act_light.triggered.connect(lambda: self._set_theme('Light'))
 
-        # Toolbar row
-        row = QHBoxLayout()
+        # Toolbar row; one panel so a tab switch shows/hides it in a single call
+        self.compare_panel = QWidget()
+        row = QHBoxLayout(self.compare_panel)
+        row.setContentsMargins(0, 0, 0, 0)
         row.addWidget(QLabel('Company:'))
         self.company_combo = QComboBox()
-        self.company_combo.currentIndexChanged.connect(self._refresh_table)
+        # Coalesce arrow-key/wheel scrolling through companies into one refresh; code that
+        # changes the selection itself calls _refresh_table() directly
+        self._company_timer = QTimer(self)
+        self._company_timer.setSingleShot(True)
+        self._company_timer.setInterval(150)
+        self._company_timer.timeout.connect(self._refresh_table)
+        # Not connected to start() directly: the int index would be taken as the interval
+        self.company_combo.currentIndexChanged.connect(lambda _idx: self._company_timer.start())
         self.company_combo.currentIndexChanged.connect(self._update_compare_actions)
         row.addWidget(self.company_combo, 2)
 
@@ -132,7 +591,12 @@ class MainWindow(QMainWindow):
         row.addWidget(self.search_mode)
         self.search_edit = QLineEdit()
         self.search_edit.setPlaceholderText('Type to search...')
-        self.search_edit.textChanged.connect(self._on_search_changed)
+        # Debounce typing: re-query only once the user pauses
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self._on_search_changed)
+        self.search_edit.textChanged.connect(self._search_timer.start)
         row.addWidget(self.search_edit, 3)
 
         # Compare target selector
@@ -154,58 +618,70 @@ class MainWindow(QMainWindow):
 
         # Spacer ends toolbar
 
-        compare_v.addLayout(row)
+        compare_v.addWidget(self.compare_panel)
 
-        # Table with company column
-        self.table = QTableWidget(0, 5)
-        self.table.setHorizontalHeaderLabels(['Manufacturer', 'Part NO', 'Compatibility', 'Match %', 'Category'])
-        # Column sizing: make 'Part NO' wider, others fit content
+        # Table with company column; rows live in the model and are painted on demand
+        self.table = QTableView()
+        self.table_model = CompareTableModel(self.table)
+        self.table.setModel(self.table_model)
+        self.table.setItemDelegateForColumn(1, PdfButtonDelegate(self._download_datasheet, self.table))
+        self.table.setMouseTracking(True)
+        # Column sizing: 'Part NO' stretches, others start at fixed widths the user can drag.
+        # ResizeToContents would measure every row again on each refresh.
         t_header = self.table.horizontalHeader()
-        t_header.setSectionResizeMode(QHeaderView.ResizeToContents)
+        t_header.setSectionResizeMode(QHeaderView.Interactive)
         t_header.setSectionResizeMode(1, QHeaderView.Stretch)  # Part NO column
+        for col, width in ((0, 190), (2, 150), (3, 110), (4, 120)):
+            self.table.setColumnWidth(col, width)
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self.table.setAlternatingRowColors(True)
         self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
-        self.table.cellDoubleClicked.connect(self._open_details)
+        self.table.doubleClicked.connect(lambda idx: self._open_details(idx.row(), idx.column()))
         # Enable interactive sorting
         self.table.setSortingEnabled(True)
-        # Ensure enough row height for icon + text
+        # Ensure enough row height for icon + text; Fixed rows are never measured per row
         try:
+            self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
             self.table.verticalHeader().setDefaultSectionSize(36)
         except Exception:
             pass
         compare_v.addWidget(self.table)
         # Add compare tab
         self.tabs.addTab(compare_page, 'Compare')
-        # Build and add NCO tab
-        nco_page = self._build_nco_tab()
-        self.tabs.addTab(nco_page, 'NCO/Commission')
+        # NCO tab starts empty; _on_tab_changed builds it (and scores its entries) on first visit
+        self._nco_page = QWidget()
+        self.tabs.addTab(self._nco_page, 'NCO/Commission')
         # Toggle action enabled states when switching tabs
+        self._compare_tab_actions = (self.act_add_mcu, self.act_add_company, self.act_rename_company, self.act_delete_company)
+        self._nco_tab_actions = (self.act_nco_add_org, self.act_nco_rename_org, self.act_nco_delete_org, self.act_nco_add_entry,
+                                 self.act_nco_edit_selected, self.act_nco_delete_entry, self.act_nco_view)
         self.tabs.currentChanged.connect(self._on_tab_changed)
         self._on_tab_changed(self.tabs.currentIndex())
 
     def _print_current(self):
         # Determine which widget to print based on current tab
         # If a Details dialog is open and visible, print that instead
-        if hasattr(self, '_details_dialog') and getattr(self, '_details_dialog', None) is not None:
+        dlg = self._details_dialog
+        if dlg is not None:
             try:
-                if self._details_dialog.isVisible():
+                if dlg.isVisible():
                     # Call public wrapper on the dialog
-                    if hasattr(self._details_dialog, 'print_details'):
-                        self._details_dialog.print_details()
+                    dlg.print_details()
                     return
             except Exception:
                 pass
-        idx = self.tabs.currentIndex() if hasattr(self, 'tabs') else 0
+        idx = self.tabs.currentIndex()
         target = None
         title = 'StriveFit'
-        if idx == 0 and hasattr(self, 'table'):
+        font_pt = 12
+        landscape = False
+        if idx == 0:
             target = self.table
             title = 'Compare'
             font_pt = 11
             landscape = False
-        elif idx == 1 and hasattr(self, 'nco_table'):
+        elif idx == 1 and self.nco_table is not None:
             target = self.nco_table
             title = 'NCO/Commission'
             font_pt = 11
@@ -215,10 +691,7 @@ class MainWindow(QMainWindow):
             return
         # For tables, open a print dialog and render a text-only table via QTextDocument
         try:
-            if isinstance(target, QTableWidget):
-                # Defaults if not set above
-                font_pt = locals().get('font_pt', 12)
-                landscape = locals().get('landscape', False)
+            if isinstance(target, QTableView):
                 self._print_table_full(target, title, font_pt=font_pt, landscape=landscape)
             else:
                 self._print_widget(target, title)
@@ -248,7 +721,7 @@ class MainWindow(QMainWindow):
         finally:
             painter.end()
 
-    def _print_table_full(self, table: QTableWidget, title: str = '', font_pt: int = 12, landscape: bool = False):
+    def _print_table_full(self, table: QTableView, title: str = '', font_pt: int = 12, landscape: bool = False):
         # Build text-only HTML and print via QTextDocument
         html = self._table_to_html(table, font_pt=font_pt)
         if not html:
@@ -295,34 +768,33 @@ class MainWindow(QMainWindow):
 
     def _export_current_table_pdf(self):
         # If a Details dialog is open and visible, export that instead
-        if hasattr(self, '_details_dialog') and getattr(self, '_details_dialog', None) is not None:
+        dlg = self._details_dialog
+        if dlg is not None:
             try:
-                if self._details_dialog.isVisible():
-                    if hasattr(self._details_dialog, 'export_details_pdf'):
-                        self._details_dialog.export_details_pdf()
+                if dlg.isVisible():
+                    dlg.export_details_pdf()
                     return
             except Exception:
                 pass
-        idx = self.tabs.currentIndex() if hasattr(self, 'tabs') else 0
+        idx = self.tabs.currentIndex()
         target = None
         title = 'StriveFit'
-        if idx == 0 and hasattr(self, 'table'):
+        font_pt = 12
+        landscape = False
+        if idx == 0:
             target = self.table
             title = 'Compare'
             font_pt = 11
             landscape = False
-        elif idx == 1 and hasattr(self, 'nco_table'):
+        elif idx == 1 and self.nco_table is not None:
             target = self.nco_table
             title = 'NCO-Commission'
             font_pt = 11
             landscape = True
-        if not isinstance(target, QTableWidget):
+        if not isinstance(target, QTableView):
             QMessageBox.information(self, 'Export PDF', 'No table available to export on this tab.')
             return
         try:
-            # Defaults if not set above
-            font_pt = locals().get('font_pt', 12)
-            landscape = locals().get('landscape', False)
             self._export_table_pdf(target, f"{title}.pdf", prompt=True, font_pt=font_pt, landscape=landscape)
         except Exception as e:
             try:
@@ -330,7 +802,7 @@ class MainWindow(QMainWindow):
             except Exception:
                 pass
 
-    def _export_table_pdf(self, table: QTableWidget, default_name: str, prompt: bool = False, *, font_pt: int = 12, landscape: bool = False):
+    def _export_table_pdf(self, table: QTableView, default_name: str, prompt: bool = False, *, font_pt: int = 12, landscape: bool = False):
         # Ask for destination path if requested
         if prompt:
             path, _ = QFileDialog.getSaveFileName(self, 'Export Table to PDF', default_name, 'PDF Files (*.pdf)')
@@ -369,31 +841,20 @@ class MainWindow(QMainWindow):
             pass
         doc.print_(printer)
 
-    def _table_to_html(self, table: QTableWidget, *, font_pt: int = 12) -> str:
+    def _table_to_html(self, table: QTableView, *, font_pt: int = 12) -> str:
         # Extract headers
-        cols = table.columnCount()
-        rows = table.rowCount()
+        model = table.model()
+        # Lazily fetched models print every row, not only those scrolled into view
+        while model.canFetchMore(QModelIndex()):
+            model.fetchMore(QModelIndex())
+        cols = model.columnCount()
+        rows = model.rowCount()
         if cols == 0 or rows == 0:
             return ''
         headers = []
         for c in range(cols):
-            hi = table.horizontalHeaderItem(c)
-            headers.append((hi.text() if hi else '').strip())
-        # Build rows from items/widgets
-        from PySide6.QtWidgets import QLabel
-        def cell_text(r: int, c: int) -> str:
-            # Prefer visual label text (chip/overlay) first to avoid numeric EditRole leakage
-            w = table.cellWidget(r, c)
-            if w is not None:
-                if isinstance(w, QLabel) and w.text():
-                    return w.text()
-                lbl = w.findChild(QLabel)
-                if lbl is not None and lbl.text():
-                    return lbl.text()
-            it = table.item(r, c)
-            if it is not None and it.text():
-                return it.text()
-            return ''
+            hd = model.headerData(c, Qt.Horizontal, Qt.DisplayRole)
+            headers.append(('' if hd is None else str(hd)).strip())
         # HTML with simple borders, compact font
         html = [
             '<html><head><meta charset="utf-8">',
@@ -406,139 +867,154 @@ class MainWindow(QMainWindow):
             '<table>'
         ]
         # Header row
-        html.append('<tr>')
-        for h in headers:
-            html.append(f'<th>{h}</th>')
-        html.append('</tr>')
-        # Data rows
+        html.append('<tr>' + ''.join(f'<th>{h}</th>' for h in headers) + '</tr>')
+        # Data rows: both tables paint their PDF pills with delegates, so the model text is the cell text
+        index = model.index
         for r in range(rows):
-            html.append('<tr>')
+            cells = []
             for c in range(cols):
-                txt = cell_text(r, c)
+                val = index(r, c).data(Qt.DisplayRole)
                 # Escape HTML special chars
-                txt = (txt or '').replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-                html.append(f'<td>{txt}</td>')
-            html.append('</tr>')
+                txt = '' if val is None else str(val)
+                cells.append(f'<td>{txt.translate(_HTML_ESCAPE)}</td>')
+            html.append('<tr>' + ''.join(cells) + '</tr>')
         html.append('</table></body></html>')
         return ''.join(html)
 
-    def _compose_table_image(self, table: QTableWidget):
-        """Build a full-image snapshot by cloning the table into an offscreen widget.
-        This avoids viewport-only rendering and ensures all rows/columns are captured."""
+    def _invalidate_caches(self):
+        # Call after any add/edit/delete of companies or MCUs
+        self._companies_cache = None
+        self._companies_map = None
+        self._competitors_lc_cache = None
+        self._our_mcus_cache = None
+        self._candidates_cache = None
+        self._mcu_rows_cache.clear()
+        self._competitor_ids_cache = None
+        self._our_mcus_version += 1
+        self._score_cache.clear()
+        self._nco_score_cache.clear()
+        # Batches still in flight were scored on the old data and are dropped on arrival
+        for pending in self._score_pending.values():
+            pending.clear()
+        self._score_waiting.clear()
+        self._force_refresh = True
+
+    def _score_cache_file(self) -> str:
+        # Scores depend on every MCU's features, the weights and the scoring rules, so all of them go into the name
+        payload = json.dumps([SCORING_VERSION, self.db.all_mcus(), self._get_feature_columns(), DEFAULT_WEIGHTS],
+                             sort_keys=True, default=str)
+        digest = hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+        return os.path.join(_SCORE_CACHE_DIR, f'score_cache_{digest}.json')
+
+    def _load_score_cache(self):
+        """Seed the compare and NCO score caches from the last session if the MCU data is unchanged."""
         try:
-            cols = table.columnCount()
-            rows = table.rowCount()
-            if cols == 0 or rows == 0:
-                return None, 0, 0
-            # Create offscreen table
-            clone = QTableWidget(rows, cols)
-            clone.setStyleSheet(table.styleSheet())
-            # Headers
-            for c in range(cols):
-                hdr = table.horizontalHeaderItem(c)
-                clone.setHorizontalHeaderItem(c, QTableWidgetItem(hdr.text() if hdr else ''))
-                try:
-                    cw = table.columnWidth(c)
-                    clone.setColumnWidth(c, cw)
-                except Exception:
-                    pass
-            # Copy content text for each cell (prefer item text; fallback to widget label text)
-            from PySide6.QtWidgets import QLabel
-            for r in range(rows):
-                for c in range(cols):
-                    txt = ''
-                    it = table.item(r, c)
-                    if it is not None:
-                        txt = it.text()
-                    else:
-                        w = table.cellWidget(r, c)
-                        if w is not None:
-                            # try to find a QLabel child that holds the text
-                            lbl = w.findChild(QLabel)
-                            if lbl is not None:
-                                txt = lbl.text()
-                    clone.setItem(r, c, QTableWidgetItem(txt))
-                # Preserve row height
-                try:
-                    clone.setRowHeight(r, table.rowHeight(r))
-                except Exception:
-                    pass
-            # Compute full size (headers + rows)
-            hh = table.horizontalHeader()
-            vh = table.verticalHeader()
-            # Prefer clone metrics; fallback to table metrics
-            header_h = max(clone.horizontalHeader().height(), hh.height(), 24)
-            vh_w = max(clone.verticalHeader().width(), vh.width(), 24)
-            # Sum of row heights (prefer clone values if set)
-            try:
-                content_h = sum(max(clone.rowHeight(r), table.sizeHintForRow(r) or 24) for r in range(rows))
-                if content_h <= 0:
-                    raise ValueError()
-            except Exception:
-                content_h = sum(max(table.rowHeight(r), table.sizeHintForRow(r) or 24) for r in range(rows))
-            # Sum of column widths, fallback to viewport width if sum is tiny
-            try:
-                sum_cols = sum(max(table.columnWidth(c), hh.sectionSize(c)) for c in range(cols))
-            except Exception:
-                sum_cols = sum(table.columnWidth(c) for c in range(cols))
-            if sum_cols <= 0:
-                sum_cols = sum(max(clone.columnWidth(c), clone.horizontalHeader().sectionSize(c)) for c in range(cols))
-            if sum_cols <= 0:
-                sum_cols = max(table.viewport().width(), clone.viewport().width())
-            total_w = vh_w + sum_cols + 2
-            total_h = header_h + content_h + 2
-            if total_w <= 2 or total_h <= 2:
-                # Fallback: try rendering the live table directly using computed geometry
-                # Compute geometry from the live table
-                try:
-                    live_h = max(header_h + sum(max(table.rowHeight(r), table.sizeHintForRow(r) or 24) for r in range(rows)) + 2, 50)
-                    live_w = max(vh.width() + sum(max(table.columnWidth(c), hh.sectionSize(c)) for c in range(cols)) + 2, 200)
-                    # Temporarily resize the live table for full render
-                    old_size = table.size()
-                    table.resize(live_w, live_h)
-                    QApplication.processEvents()
-                    img = QImage(live_w, live_h, QImage.Format_ARGB32)
-                    img.fill(0xFFFFFFFF)
-                    p = QPainter(img)
-                    try:
-                        table.render(p)
-                    finally:
-                        p.end()
-                    # Restore size
-                    table.resize(old_size)
-                    return img, live_w, live_h
-                except Exception:
-                    return None, 0, 0
-            # Size the clone appropriately before rendering
-            clone.resize(total_w, total_h)
-            clone.horizontalHeader().setVisible(True)
-            clone.verticalHeader().setVisible(True)
-            QApplication.processEvents()
-            # Render clone to image
-            img = QImage(total_w, total_h, QImage.Format_ARGB32)
-            img.fill(0xFFFFFFFF)
-            p = QPainter(img)
-            try:
-                clone.render(p)
-            finally:
-                p.end()
-            clone.deleteLater()
-            return img, total_w, total_h
+            self._score_cache_path = self._score_cache_file()
+            with open(self._score_cache_path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            candidates_by_id = {c['id']: c for c in self._get_candidates()[0]}
+            for name, cache in (('compare', self._score_cache), ('nco', self._nco_score_cache)):
+                for company_id, mcu_id, our_id, best_id, score in saved[name]:
+                    best = candidates_by_id.get(best_id)
+                    if best is None and best_id is not None:
+                        continue
+                    cache[(company_id, mcu_id, our_id)] = (best, score)
+        except Exception:
+            # Missing or unreadable cache: scores are simply recomputed
+            self._score_cache.clear()
+            self._nco_score_cache.clear()
+
+    def _save_score_cache(self):
+        # Written per table as [company_id, mcu_id, our_id, best_id, score]; best dicts are rebuilt on load
+        try:
+            path = self._score_cache_file()
+            os.makedirs(_SCORE_CACHE_DIR, exist_ok=True)
+            saved = {name: [[k[0], k[1], k[2], best['id'] if best else None, score]
+                            for k, (best, score) in cache.items()]
+                     for name, cache in (('compare', self._score_cache), ('nco', self._nco_score_cache))}
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(saved, f)
+            # This window's earlier file (data edited since) can never match again; files of
+            # other installs/data folders sharing the directory are left alone
+            old_path, self._score_cache_path = self._score_cache_path, path
+            if old_path and old_path != path and os.path.exists(old_path):
+                os.remove(old_path)
         except Exception:
-            return None, 0, 0
+            pass
+
+    def closeEvent(self, event):
+        self._save_score_cache()
+        super().closeEvent(event)
+
+    def _get_companies(self) -> List[Dict[str, Any]]:
+        # All companies as returned by db.list_companies(''); treat as read-only
+        if self._companies_cache is None:
+            self._companies_cache = self.db.list_companies('')
+        return self._companies_cache
+
+    def _get_competitors_lc(self):
+        # (company, lowercased name) for competitor companies; Company search scans the names without re-lowering
+        if self._competitors_lc_cache is None:
+            self._competitors_lc_cache = [(c, c['name'].lower()) for c in self._get_companies() if not c['is_ours']]
+        return self._competitors_lc_cache
+
+    def _get_companies_map(self) -> Dict[int, str]:
+        # Company id -> name, shared by both tables
+        if self._companies_map is None:
+            self._companies_map = {c['id']: c['name'] for c in self._get_companies()}
+        return self._companies_map
+
+    def _get_competitor_ids(self):
+        # (company name -> id, (company id, MCU name) -> MCU id) over competitors; the first
+        # company per name and first MCU per name win, as a linear scan over them would find
+        if self._competitor_ids_cache is None:
+            company_by_name: Dict[str, int] = {}
+            for c in self._get_companies():
+                if not c.get('is_ours'):
+                    company_by_name.setdefault(c.get('name'), c['id'])
+            mcu_ids: Dict[tuple, int] = {}
+            for m in self.db.list_all_competitor_mcus():
+                mcu_ids.setdefault((m.get('company_id'), m.get('name')), m.get('id'))
+            self._competitor_ids_cache = (company_by_name, mcu_ids)
+        return self._competitor_ids_cache
+
+    def _get_our_mcus(self) -> List[Dict[str, Any]]:
+        if self._our_mcus_cache is None:
+            # The DB hands out freshly loaded dicts, so no defensive copy is needed
+            self._our_mcus_cache = self.db.list_our_mcus()
+        return self._our_mcus_cache
+
+    def _get_candidates(self):
+        # (candidates, columns) for best_match; columns let it score all OUR MCUs per feature in one pass
+        if self._candidates_cache is None:
+            feat_cols = self._get_feature_columns()
+            candidates = [_score_candidate(mm, feat_cols) for mm in self._get_our_mcus()]
+            self._candidates_cache = (candidates, prepare_candidates(candidates))
+        return self._candidates_cache
+
+    def _get_feature_columns(self):
+        if self._feat_cols_cache is None:
+            self._feat_cols_cache = tuple(self.db.feature_columns())
+        return self._feat_cols_cache
 
     def _load_companies(self):
         # Only filter companies when search mode is Company
-        query = self.search_edit.text() if hasattr(self, 'search_edit') else ''
+        query = self.search_edit.text() if self.search_edit is not None else ''
         search = (query or '').lower() if self.search_mode.currentText() == 'Company' else ''
-        companies = [c for c in self.db.list_companies(search) if not c['is_ours']]
+        self._company_search = search
+        competitors = self._get_competitors_lc()
+        companies = [c for c, name_lc in competitors if search in name_lc] if search else [c for c, _ in competitors]
         current_id = self.company_combo.currentData() if self.company_combo.count() else None
-        self.company_combo.blockSignals(True)
-        self.company_combo.clear()
+        # Build the list off-screen and swap it in with a single model reset
+        model = QStandardItemModel(len(companies) + 1, 1, self.company_combo)
         # Add an "All Companies" option to view every competitor's MCUs
-        self.company_combo.addItem('All Companies', None)
-        for c in companies:
-            self.company_combo.addItem(c['name'], c['id'])
+        model.setItem(0, 0, QStandardItem('All Companies'))
+        for i, c in enumerate(companies, 1):
+            item = QStandardItem(c['name'])
+            item.setData(c['id'], Qt.UserRole)
+            model.setItem(i, 0, item)
+        self.company_combo.blockSignals(True)
+        self.company_combo.setModel(model)
         self.company_combo.blockSignals(False)
         # Prefer to retain selection; otherwise select first if available
         idx = -1
@@ -551,15 +1027,17 @@ class MainWindow(QMainWindow):
             self.company_combo.setCurrentIndex(0)
         else:
             # No companies match; clear the table
-            self.table.setRowCount(0)
+            self.table_model.set_rows([])
         # Load our MCU choices
         self._load_our_mcu_choices()
         # Ensure table reflects the currently visible/selected company list
         self._refresh_table()
+        # The selection change above queued a debounced refresh; this one already covered it
+        self._company_timer.stop()
 
     def _load_our_mcu_choices(self):
         sel_id = self.compare_combo.currentData() if self.compare_combo.count() else None
-        our_mcus = self.db.list_our_mcus()
+        our_mcus = self._get_our_mcus()
         self.compare_combo.blockSignals(True)
         self.compare_combo.clear()
         self.compare_combo.addItem('Auto (Best Match)', None)
@@ -575,194 +1053,193 @@ class MainWindow(QMainWindow):
         return self.compare_combo.currentData()
 
     def _refresh_table(self):
+        if self.tabs.currentIndex() != 0:
+            # Hidden table: defer the work until the Compare tab is shown again
+            self._stale_tabs.add(0)
+            return
         if self.company_combo.count() == 0:
             # No companies to show; clear table
-            self.table.setRowCount(0)
+            self.table_model.set_rows([])
+            self._last_refresh_sig = None
             return
-        # Disable sorting during population to avoid None items and blank cells
-        prev_sorting = self.table.isSortingEnabled()
-        if prev_sorting:
-            self.table.setSortingEnabled(False)
-        company_id = self.company_combo.currentData()
-        query = (self.search_edit.text() or '') if hasattr(self, 'search_edit') else ''
+        # Combo/search signals often fire without a material change; skip identical re-renders.
+        # The query only affects the table in MCU mode (Company mode filters the dropdown).
         mode = self.search_mode.currentText()
-        our_mcus_rows = self.db.list_our_mcus()
-        our_mcus = [dict(r) for r in our_mcus_rows]
-        feat_cols = self.db.feature_columns()
+        sig = (self.company_combo.currentData(), mode,
+               self.search_edit.text() if mode == 'MCU' else '',
+               self._selected_our_mcu_id(), self._our_mcus_version)
+        if sig == self._last_refresh_sig and not self._force_refresh:
+            return
+        company_id = self.company_combo.currentData()
+        query = (self.search_edit.text() or '') if self.search_edit is not None else ''
+        our_mcus = self._get_our_mcus()
+        feat_cols = self._get_feature_columns()
+        companies_map = self._get_companies_map()
         q = (query or '')
-        import re
-        def _norm(s: str) -> str:
-            return re.sub(r"[^a-z0-9]", "", (s or '').lower())
-        qn = _norm(q)
+        # Global MCU search or All Companies: every competitor MCU in one bulk read
+        scope = None if ((mode == 'MCU' and q) or company_id is None) else company_id
+        cached_rows = self._mcu_rows_cache.get(scope)
+        if cached_rows is None:
+            if scope is None:
+                mcus_all = self.db.list_all_competitor_mcus()
+            else:
+                mcus_all = self.db.list_mcus_by_company(scope)
+            # Normalize names once per fetch so typing only rescans these strings
+            names_norm = [_NAME_NORM_RE.sub('', (m.get('name', '') or '').lower()) for m in mcus_all]
+            cached_rows = self._mcu_rows_cache[scope] = (mcus_all, names_norm)
+        mcus_all, names_norm = cached_rows
+
         if mode == 'MCU' and q:
-            # Global MCU search across all competitor companies
-            mcus_all = []
-            all_companies = self.db.list_companies('')
-            companies_map = {c['id']: c['name'] for c in all_companies}
-            for c in all_companies:
-                if c.get('is_ours'):
-                    continue
-                mcus_all.extend([dict(r) for r in self.db.list_mcus_by_company(c['id'])])
-        else:
-            # Company context (including All Companies when company_id is None)
-            all_companies = self.db.list_companies('')
-            if company_id is None:
-                mcus_all = []
-                companies_map = {c['id']: c['name'] for c in all_companies}
-                for c in all_companies:
-                    if c.get('is_ours'):
-                        continue
-                    mcus_all.extend([dict(r) for r in self.db.list_mcus_by_company(c['id'])])
+            qn = _NAME_NORM_RE.sub('', q.lower())
+            # Typing usually extends the last query: rows that matched it are the only candidates
+            last = self._mcu_search_cache
+            if last is not None and last[0] is cached_rows and last[1] in qn:
+                pool = zip(last[2], last[3])
             else:
-                mcus_all = [dict(r) for r in self.db.list_mcus_by_company(company_id)]
-                companies_map = {company_id: next((c['name'] for c in all_companies if c['id']==company_id), '')}
+                pool = zip(mcus_all, names_norm)
+            hits = [(m, nn) for m, nn in pool if qn in nn]
+            mcus = [m for m, _ in hits]
+            self._mcu_search_cache = (cached_rows, qn, mcus, [nn for _, nn in hits])
+        else:
+            mcus = mcus_all
 
-        mcus = [m for m in mcus_all if (qn in _norm(m.get('name', '')))] if (mode == 'MCU' and q) else mcus_all
+        chosen_id = self._selected_our_mcu_id()
+        if chosen_id is not None:
+            # Use selected our MCU only; nothing to compare if it no longer exists
+            mm = next((x for x in our_mcus if x['id'] == chosen_id), None)
+            if mm is None:
+                mcus = []
+            else:
+                our_feats = {k: mm.get(k) for k in feat_cols}
+                chosen_best = {'id': mm['id'], 'name': mm['name'], **our_feats}
 
-        self.table.setRowCount(0)
-        counts = {'Best Match': 0, 'Partial': 0, 'No Match': 0}
+        # Score every row up front (sorting needs it), then hand the rows to the model in one reset
+        score_cache = self._score_cache
+        # A forced re-run may be consuming a batch that just landed; don't drop it
+        if len(score_cache) > _SCORE_CACHE_MAX and not self._force_refresh:
+            score_cache.clear()
+        jobs = []
         for mcu in mcus:
-            # Build feature dicts
-            # Include flags needed by similarity rules (e.g., is_dsp, is_fpga)
-            target = ({k: mcu.get(k) for k in feat_cols}
-                      | {'name': mcu.get('name', ''), 'is_dsp': mcu.get('is_dsp'), 'is_fpga': mcu.get('is_fpga')})
-            chosen_id = self._selected_our_mcu_id()
-            if chosen_id is None:
-                best, score, _ = best_match(target, [{k: mm.get(k) for k in feat_cols} | {'id': mm['id'], 'name': mm['name']} for mm in our_mcus])
-                category = categorize(score)
-            else:
-                # Use selected our MCU only
-                mm = next((x for x in our_mcus if x['id'] == chosen_id), None)
-                if mm is None:
-                    continue
-                from mcu_compare.engine.similarity import weighted_similarity
-                score, _ = weighted_similarity(target, {k: mm.get(k) for k in feat_cols})
-                category = categorize(score)
-                best = {'id': mm['id'], 'name': mm['name'], **{k: mm.get(k) for k in feat_cols}}
-
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            # Company name
-            comp_name = companies_map.get(mcu.get('company_id'), '')
-            self.table.setItem(row, 0, QTableWidgetItem(comp_name))
-            # Part NO item with ID attached for sorting/selection
-            part_item = QTableWidgetItem(mcu['name'])
-            part_item.setData(Qt.UserRole, mcu['id'])
-            self.table.setItem(row, 1, part_item)
-            # Overlay a small PDF button in front of the name
-            from PySide6.QtWidgets import QWidget, QHBoxLayout, QToolButton, QLabel
-            cell = QWidget()
-            h = QHBoxLayout(cell)
-            h.setContentsMargins(4, 0, 4, 0)
-            h.setSpacing(6)
-            pdf_btn = QToolButton()
-            pdf_btn.setToolTip('Open datasheet (local)')
-            pdf_btn.setCursor(QCursor(Qt.PointingHandCursor))
-            pdf_btn.setAutoRaise(True)
-            # Use text instead of icon, styled as a pill button
-            pdf_btn.setText('PDF')
-            pdf_btn.setMinimumWidth(40)
-            pdf_btn.setFixedHeight(22)
-            pdf_btn.setStyleSheet(
-                "QToolButton {"
-                "  padding: 2px 8px;"
-                "  border: 1px solid #3a6cf4;"
-                "  border-radius: 11px;"
-                "  background-color: rgba(58,108,244,0.15);"
-                "  color: #ffffff;"
-                "  font-weight: 600;"
-                "}"
-                "QToolButton:hover {"
-                "  background-color: rgba(58,108,244,0.28);"
-                "  border-color: #5e86f7;"
-                "}"
-                "QToolButton:pressed {"
-                "  background-color: rgba(58,108,244,0.40);"
-                "  border-color: #86a3fb;"
-                "}"
-            )
-            # Capture current name in lambda default
-            pdf_btn.clicked.connect(lambda _, name=mcu['name']: self._download_datasheet(name))
-            name_lbl = QLabel(mcu['name'])
-            name_lbl.setContentsMargins(0,0,0,0)
-            name_lbl.setAlignment(Qt.AlignVCenter | Qt.AlignLeft)
-            h.addWidget(pdf_btn)
-            h.addWidget(name_lbl)
-            h.addStretch(1)
-            self.table.setCellWidget(row, 1, cell)
-            # Compatibility item with our_mcu_id (or None)
-            compat_item = QTableWidgetItem(best['name'] if best else '-')
-            compat_item.setData(Qt.UserRole, best['id'] if best else None)
-            self.table.setItem(row, 2, compat_item)
-            item_score = QTableWidgetItem(f"{score:.1f}")
-            item_score.setTextAlignment(Qt.AlignCenter)
-            # Ensure numeric sort on Match % using EditRole
-            item_score.setData(Qt.EditRole, float(f"{score:.4f}"))
-            self.table.setItem(row, 3, item_score)
-            # Backing item for sorting by custom order
-            cat_item = QTableWidgetItem(category)
-            # Higher value sorts first when descending; use 2,1,0 for Best/Partial/No
-            order_map = {'Best Match': 2, 'Partial': 1, 'No Match': 0}
-            cat_item.setData(Qt.DisplayRole, category)  # ensure visible text is the label
-            cat_item.setData(Qt.EditRole, order_map.get(category, -1))  # numeric for sorting
-            cat_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row, 4, cat_item)
-            # Category chip as QLabel overlay for visuals
-            from PySide6.QtWidgets import QLabel
-            chip = QLabel(category)
-            chip.setAlignment(Qt.AlignCenter)
-            color = CATEGORY_COLORS.get(category, '#444')
-            chip.setStyleSheet(f"QLabel {{ background-color: {color}; color: white; border-radius: 10px; padding: 2px 6px; margin: 0px; }}")
-            chip.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
-            self.table.setCellWidget(row, 4, chip)
-            self.table.setRowHeight(row, 36)
-            # Tally counts
-            if category in counts:
-                counts[category] += 1
+            key = (mcu.get('company_id'), mcu['id'], chosen_id)
+            if key not in score_cache:
+                target = _score_target(mcu, feat_cols)
+                if chosen_id is None:
+                    jobs.append((key, target, None, None))
+                else:
+                    jobs.append((key, target, our_feats, chosen_best))
+        if not self._score_missing('compare', score_cache, jobs):
+            # Table keeps its current rows until _on_scores_ready re-runs this refresh
+            self._last_refresh_sig = sig
+            self._force_refresh = False
+            return
+        rows = []
+        for mcu in mcus:
+            best, score = score_cache[(mcu.get('company_id'), mcu['id'], chosen_id)]
+            category = categorize(score)
+            rows.append((companies_map.get(mcu.get('company_id'), ''), mcu['name'], mcu['id'],
+                         best['name'] if best else None, best['id'] if best else None,
+                         float(f"{score:.4f}"), category))
+        # Tally categories in one pass; missing ones read as 0
+        counts = Counter(r[6] for r in rows)
 
+        self.table_model.set_rows(rows)
         # Update counts label
         self.cat_counts_label.setText(
             f"Best Match: {counts['Best Match']}   |   Partial: {counts['Partial']}   |   No Match: {counts['No Match']}"
         )
-        # Restore previous sorting state
-        if prev_sorting:
-            self.table.setSortingEnabled(True)
+        self._last_refresh_sig = sig
+        self._force_refresh = False
+
+    def _score_missing(self, table: str, cache: Dict, jobs) -> bool:
+        """Fill cache for jobs. Returns False when the table has to wait for the thread pool
+        (jobs handed to it, or already queued by an earlier refresh); _on_scores_ready then
+        re-runs the table's refresh."""
+        # Every refresh takes a new token so batches from earlier refreshes can't repaint
+        token = self._score_tokens[table] = self._score_tokens[table] + 1
+        self._score_waiting.discard(table)
+        pending = self._score_pending[table]
+        # Keys an earlier batch is already scoring are waited for, not queued again
+        in_flight = any(job[0] in pending for job in jobs)
+        if in_flight:
+            jobs = [job for job in jobs if job[0] not in pending]
+        if jobs:
+            candidates, columns = self._get_candidates()
+            if len(jobs) > _INLINE_SCORE_MAX:
+                for job in jobs:
+                    pending[job[0]] = token
+                QThreadPool.globalInstance().start(
+                    _ScoreTask(table, token, self._our_mcus_version, jobs, candidates, columns, self._score_signals))
+                return False
+            for key, best, score in _score_jobs(jobs, candidates, columns):
+                cache[key] = (best, score)
+        if in_flight:
+            self._score_waiting.add(table)
+            return False
+        return True
+
+    def _on_scores_ready(self, table: str, token: int, version: int, results):
+        # Results from before an edit were computed on stale data
+        if version != self._our_mcus_version:
+            return
+        pending = self._score_pending[table]
+        for key in [k for k, t in pending.items() if t == token]:
+            del pending[key]
+        if results is None:
+            # Failed batch: the table kept its old rows, so the next refresh with the same inputs
+            # must not be skipped; nothing re-runs here so a failing batch can't loop
+            if table == 'compare':
+                self._last_refresh_sig = None
+            self._score_waiting.discard(table)
+            return
+        cache = self._score_cache if table == 'compare' else self._nco_score_cache
+        for key, best, score in results:
+            cache[key] = (best, score)
+        # An older batch only repaints when the latest refresh was waiting on it and nothing else
+        if token != self._score_tokens[table] and not (table in self._score_waiting and not pending):
+            return
+        if table == 'compare':
+            self._force_refresh = True
+            self._refresh_table()
+        else:
+            self._nco_scores_landed = True
+            self._refresh_nco_table()
 
     def _download_datasheet(self, mcu_name: str):
         # Open a local PDF from the datasheets folder by matching the name.
-        import os, re
         datasheet_dir = r'e:\MCU-com\datasheets'
         try:
             if not os.path.isdir(datasheet_dir):
                 os.makedirs(datasheet_dir, exist_ok=True)
             raw = (mcu_name or '').strip()
-            # Primary key: substring before '-' (e.g., 'XC7A200T' from 'XC7A200T-2FBG6761 (FPGA)')
-            base = raw.split('-', 1)[0].strip()
-            # Fallback if no '-' present: strip at first space or '('
-            if base == raw:
-                base = re.split(r"\s|\(", raw, maxsplit=1)[0]
-            norm_base = re.sub(r'[^a-z0-9]+', '', base.lower())
-            norm_full = re.sub(r'[^a-z0-9]+', '', raw.lower())
-            exact = None
+            name_keys = self._ds_name_keys.get(raw)
+            if name_keys is None:
+                # Primary key: substring before '-' (e.g., 'XC7A200T' from 'XC7A200T-2FBG6761 (FPGA)')
+                base = raw.split('-', 1)[0].strip()
+                # Fallback if no '-' present: strip at first space or '('
+                if base == raw:
+                    base = _DATASHEET_BASE_SPLIT_RE.split(raw, maxsplit=1)[0]
+                name_keys = self._ds_name_keys[raw] = (_datasheet_key(base), _datasheet_key(raw))
+            norm_base, norm_full = name_keys
+            mtime = os.stat(datasheet_dir).st_mtime_ns
+            if mtime != self._ds_cache_mtime:
+                self._ds_exact = {}
+                self._ds_keys = []
+                with os.scandir(datasheet_dir) as entries:
+                    for e in entries:
+                        if not e.name.lower().endswith('.pdf') or not e.is_file():
+                            continue
+                        key = _datasheet_key(e.name.rpartition('.')[0])
+                        self._ds_exact.setdefault(key, (len(self._ds_keys), e.path))
+                        self._ds_keys.append((key, e.path))
+                self._ds_cache_mtime = mtime
+            # Exact base or full-name match; the earlier file in the listing wins
+            hits = [self._ds_exact[k] for k in (norm_base, norm_full) if k and k in self._ds_exact]
+            exact = min(hits)[1] if hits else None
             partial = []
-            for fn in os.listdir(datasheet_dir):
-                if not fn.lower().endswith('.pdf'):
-                    continue
-                key = re.sub(r'[^a-z0-9]+', '', os.path.splitext(fn)[0].lower())
-                # Try exact base match first
-                if norm_base and key == norm_base:
-                    exact = os.path.join(datasheet_dir, fn)
-                    break
-                # Then exact full-name match
-                if norm_full and key == norm_full:
-                    exact = os.path.join(datasheet_dir, fn)
-                    break
+            if exact is None:
                 # Then substring matches (prefer base)
-                if norm_base and norm_base in key:
-                    partial.append(os.path.join(datasheet_dir, fn))
-                    continue
-                if norm_full and norm_full in key:
-                    partial.append(os.path.join(datasheet_dir, fn))
+                partial = [path for key, path in self._ds_keys
+                           if (norm_base and norm_base in key) or (norm_full and norm_full in key)]
             target = exact or (partial[0] if len(partial) == 1 else None)
             if target:
                 os.startfile(target)
@@ -783,13 +1260,13 @@ class MainWindow(QMainWindow):
     def _open_add_dialog(self):
         dlg = AddMCUDialog(self.db, self)
         if dlg.exec():
+            self._invalidate_caches()
             self._refresh_table()
 
     def _open_details(self, row: int, column: int):
-        part_item = self.table.item(row, 1)
-        compat_item = self.table.item(row, 2)
-        comp_id = part_item.data(Qt.UserRole) if part_item else None
-        our_id = self._selected_our_mcu_id() or (compat_item.data(Qt.UserRole) if compat_item else None)
+        rec = self.table_model.row_record(row)
+        comp_id = rec[2] if rec else None
+        our_id = self._selected_our_mcu_id() or (rec[4] if rec else None)
         if comp_id is None or our_id is None:
             QMessageBox.information(self, 'Details', 'No match available for detailed comparison.')
             return
@@ -800,19 +1277,10 @@ class MainWindow(QMainWindow):
         except Exception:
             comp_rec = None
         if comp_rec and int(self.db.get_company_by_id(int(comp_rec.get('company_id'))) .get('is_ours', 0)) == 1:
-            # Look up competitor company by the table's Manufacturer column text
-            company_name = self.table.item(row, 0).text() if self.table.item(row, 0) else ''
-            # Find company id by name
-            comp_id_fixed = None
-            for c in self.db.list_companies(''):
-                if not c.get('is_ours') and c.get('name') == company_name:
-                    # Find MCU by exact part name within this company
-                    part_name = part_item.text() if part_item else ''
-                    for m in self.db.list_mcus_by_company(c['id']):
-                        if m.get('name') == part_name:
-                            comp_id_fixed = m.get('id')
-                            break
-                    break
+            # Look up competitor company by the table's Manufacturer column text,
+            # then the MCU by exact part name within that company
+            company_by_name, mcu_ids = self._get_competitor_ids()
+            comp_id_fixed = mcu_ids.get((company_by_name.get(rec[0]), rec[1]))
             if comp_id_fixed is not None:
                 comp_id = comp_id_fixed
         # Prevent comparing the same MCU against itself
@@ -833,41 +1301,38 @@ class MainWindow(QMainWindow):
 
     def _edit_selected_mcu(self):
         # Edit the selected competitor MCU (from the Compare tab table)
-        if self.table.currentRow() < 0:
-            return
-        row = self.table.currentRow()
-        item = self.table.item(row, 1)
-        if item is None:
+        rec = self.table_model.row_record(self.table.currentIndex().row())
+        if rec is None:
             return
-        mcu_id = item.data(Qt.UserRole)
+        mcu_id = rec[2]
         if mcu_id is None:
             return
         dlg = EditMCUDialog(self.db, int(mcu_id), self)
         if dlg.exec():
+            self._invalidate_caches()
             self._refresh_table()
 
     def _delete_selected_mcu(self):
         # Delete the selected competitor MCU from the Compare table
-        if self.table.currentRow() < 0:
-            return
-        row = self.table.currentRow()
-        item = self.table.item(row, 1)
-        if item is None:
+        rec = self.table_model.row_record(self.table.currentIndex().row())
+        if rec is None:
             return
-        mcu_id = item.data(Qt.UserRole)
-        name = item.text() if item else ''
+        mcu_id = rec[2]
+        name = rec[1] or ''
         if mcu_id is None:
             return
         resp = QMessageBox.question(self, 'Delete MCU', f"Delete MCU '{name}'? This will remove related NCO entries.", QMessageBox.Yes | QMessageBox.No)
         if resp != QMessageBox.Yes:
             return
         if self.db.delete_mcu(int(mcu_id)):
+            self._invalidate_caches()
             self._refresh_table()
 
     def _open_add_company(self):
         dlg = AddCompanyDialog(self.db, self)
         if dlg.exec():
             new_id = dlg.created_company_id
+            self._invalidate_caches()
             self._load_companies()
             if new_id is not None:
                 idx = self.company_combo.findData(new_id)
@@ -887,6 +1352,7 @@ class MainWindow(QMainWindow):
         name, ok = QInputDialog.getText(self, 'Rename Company', 'New name:', text=current_name)
         if ok and name.strip():
             if self.db.update_company_name(int(company_id), name.strip()):
+                self._invalidate_caches()
                 self._load_companies()
                 # keep the same company selected after rename
                 idx = self.company_combo.findData(company_id)
@@ -913,24 +1379,32 @@ class MainWindow(QMainWindow):
         if resp != QMessageBox.Yes:
             return
         if self.db.delete_company(int(company_id)):
+            self._invalidate_caches()
             self._load_companies()
             self._refresh_table()
 
     def _open_nco_add(self):
-        org_id = self.nco_org_combo.currentData() if hasattr(self, 'nco_org_combo') and self.nco_org_combo.count() else None
+        org_id = self.nco_org_combo.currentData() if self.nco_org_combo is not None and self.nco_org_combo.count() else None
         dlg = AddNcoEntryDialog(self.db, self, org_id)
         if dlg.exec():
             pass
 
     def _open_nco_view(self):
-        dlg = ViewNcoEntriesDialog(self.db, self)
+        dlg = self._nco_view_dialog
+        if dlg is None:
+            dlg = ViewNcoEntriesDialog(self.db, self)
+            self._nco_view_dialog = dlg
+        else:
+            dlg.refresh()
         dlg.exec()
 
-    def _build_nco_tab(self) -> QWidget:
-        page = QWidget()
+    def _build_nco_tab(self, page: QWidget):
+        # Fills the NCO tab's placeholder page; runs the first time that tab is shown
         v = QVBoxLayout(page)
         # Actions row
-        row = QHBoxLayout()
+        self.nco_panel = QWidget()
+        row = QHBoxLayout(self.nco_panel)
+        row.setContentsMargins(0, 0, 0, 0)
         row.addWidget(QLabel('NCO/Commission:'))
         self.nco_org_combo = QComboBox()
         self.nco_org_combo.currentIndexChanged.connect(self._refresh_nco_table)
@@ -947,7 +1421,12 @@ class MainWindow(QMainWindow):
         row.addWidget(self.nco_search_mode)
         self.nco_search = QLineEdit()
         self.nco_search.setPlaceholderText('Type to search...')
-        self.nco_search.textChanged.connect(self._refresh_nco_table)
+        # Debounce typing like the Compare search box
+        self._nco_search_timer = QTimer(self)
+        self._nco_search_timer.setSingleShot(True)
+        self._nco_search_timer.setInterval(150)
+        self._nco_search_timer.timeout.connect(self._refresh_nco_table)
+        self.nco_search.textChanged.connect(self._nco_search_timer.start)
         row.addWidget(self.nco_search, 2)
         # Edit button
         self.nco_edit_btn = QPushButton('Edit Selected')
@@ -957,51 +1436,64 @@ class MainWindow(QMainWindow):
         refresh_btn.clicked.connect(self._refresh_nco_table)
         row.addWidget(refresh_btn)
         row.addStretch(1)
-        v.addLayout(row)
+        v.addWidget(self.nco_panel)
 
         # NCO table
         self.nco_table = QTableWidget(0, 7)
         self.nco_table.setHorizontalHeaderLabels(['NCO/Commission', 'Company', 'Competitor MCU', 'Quantity', 'Our MCU', 'Match %', 'Category'])
-        # Column sizing: make 'Competitor MCU' wider, others fit content
+        # Column sizing: 'Competitor MCU' stretches, others start at fixed widths (no per-refresh measuring)
         header = self.nco_table.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(QHeaderView.Interactive)
         header.setSectionResizeMode(2, QHeaderView.Stretch)  # Competitor MCU
+        for col, width in ((0, 180), (1, 190), (3, 110), (4, 150), (5, 110), (6, 120)):
+            self.nco_table.setColumnWidth(col, width)
         self.nco_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.nco_table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self.nco_table.setAlternatingRowColors(True)
         self.nco_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.nco_table.cellDoubleClicked.connect(self._open_nco_details)
+        # PDF pill painted by a delegate, like the compare table; rows sized for it up front
+        self.nco_table.setItemDelegateForColumn(2, PdfButtonDelegate(self._download_datasheet, self.nco_table))
+        self.nco_table.setMouseTracking(True)
+        self.nco_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.nco_table.verticalHeader().setDefaultSectionSize(36)
         # Enable header sorting
         self.nco_table.setSortingEnabled(True)
         v.addWidget(self.nco_table)
 
+        # Fills the org combo and runs the first refresh
         self._load_nco_orgs()
-        self._refresh_nco_table()
-        return page
 
     def _refresh_nco_table(self):
-        if not hasattr(self, 'nco_table'):
+        if self.nco_table is None:
+            return
+        if self.tabs.currentIndex() != 1:
+            # Hidden table (e.g. after an MCU edit on Compare): refresh when the NCO tab is shown
+            self._stale_tabs.add(1)
             return
         # Determine selected org
-        org_id = self.nco_org_combo.currentData() if hasattr(self, 'nco_org_combo') and self.nco_org_combo.count() else None
+        org_id = self.nco_org_combo.currentData() if self.nco_org_combo is not None and self.nco_org_combo.count() else None
         rows = self.db.list_nco_entries(org_id)
-        comps = {c['id']: c['name'] for c in self.db.list_companies('')}
+        comps = self._get_companies_map()
         orgs = {o['id']: o['name'] for o in self.db.list_nco_orgs()}
-        mcu_name: Dict[int, str] = {}
-        for c in self.db.list_companies(''):
-            for m in self.db.list_mcus_by_company(c['id']):
-                mcu_name[m['id']] = m['name']
-        feat_cols = self.db.feature_columns()
-        our_mcus = [dict(r) for r in self.db.list_our_mcus()]
+        # Bulk name map via db.list_all_mcus() rather than one list_mcus_by_company per company
+        mcu_name: Dict[int, str] = {m['id']: m['name'] for m in self.db.list_all_mcus()}
+        # One bulk read replaces per-row get_mcu_by_id; first occurrence wins, matching its search order
+        mcu_by_id: Dict[int, Dict[str, Any]] = {}
+        for m in self.db.all_mcus():
+            mcu_by_id.setdefault(m['id'], m)
+        feat_cols = self._get_feature_columns()
+        nco_scores = self._nco_score_cache
+        # A re-run consuming a batch that just landed must not drop it
+        if len(nco_scores) > _SCORE_CACHE_MAX and not self._nco_scores_landed:
+            nco_scores.clear()
+        self._nco_scores_landed = False
         # Apply text filter
-        q = self.nco_search.text().lower() if hasattr(self, 'nco_search') else ''
-        mode = self.nco_search_mode.currentText() if hasattr(self, 'nco_search_mode') else 'All'
-        def matches(row: Dict[str, Any]) -> bool:
+        q = self.nco_search.text().lower() if self.nco_search is not None else ''
+        mode = self.nco_search_mode.currentText() if self.nco_search_mode is not None else 'All'
+        def matches(row: Dict[str, Any], nco: str, comp: str, cmcu: str) -> bool:
             if not q:
                 return True
-            nco = orgs.get(row.get('org_id'), '')
-            comp = comps.get(row.get('company_id'), '')
-            cmcu = mcu_name.get(row.get('comp_mcu_id'), '')
             omcu = mcu_name.get(row.get('our_mcu_id'), '')
             qty = str(row.get('quantity', ''))
             if mode == 'All':
@@ -1016,70 +1508,73 @@ class MainWindow(QMainWindow):
                 return q in qty.lower()
             return True
 
-        filtered = [r for r in rows if matches(r)]
+        # One pass resolves the display names; the filter and the table build both reuse them
+        filtered = []
+        for r in rows:
+            nco = orgs.get(r.get('org_id'), '')
+            comp = comps.get(r.get('company_id'), '')
+            cmcu = mcu_name.get(r.get('comp_mcu_id'), '')
+            if matches(r, nco, comp, cmcu):
+                filtered.append((r, nco, comp, cmcu))
+        # Score cache misses first (inline or in the background), then build the table from the cache
+        jobs = []
+        queued = set()
+        # Entries pinned to the same OUR MCU share one feature dict
+        our_feats_by_id: Dict[Any, Dict[str, Any]] = {}
+        for r, _, _, _ in filtered:
+            comp = mcu_by_id.get(int(r.get('comp_mcu_id')))
+            if not comp:
+                continue
+            our_id = r.get('our_mcu_id')
+            key = (comp.get('company_id'), comp['id'], our_id)
+            if key in nco_scores or key in queued:
+                continue
+            queued.add(key)
+            target = _score_target(comp, feat_cols)
+            if our_id is None:
+                # compute best match across our MCUs
+                jobs.append((key, target, None, None))
+            else:
+                our_feats = our_feats_by_id.get(our_id)
+                if our_feats is None:
+                    ours = mcu_by_id.get(int(our_id))
+                    our_feats = our_feats_by_id[our_id] = {k: (ours.get(k) if ours else None) for k in feat_cols}
+                jobs.append((key, target, our_feats, None))
+        if not self._score_missing('nco', nco_scores, jobs):
+            # Table keeps its current rows until _on_scores_ready re-runs this refresh
+            return
+        self._nco_entries_by_id = {int(r.get('id', -1)): r for r in rows}
         # Temporarily disable sorting during population to avoid items shifting rows mid-insert
         prev_sorting = self.nco_table.isSortingEnabled()
         if prev_sorting:
             self.nco_table.setSortingEnabled(False)
+        # Populate in one pass: rows allocated up front, repaint deferred until done and
+        # the per-cell itemChanged/cellChanged notifications muted (nothing listens to them)
+        self.nco_table.setUpdatesEnabled(False)
+        self.nco_table.blockSignals(True)
         self.nco_table.setRowCount(0)
-        for r in filtered:
-            row = self.nco_table.rowCount()
-            self.nco_table.insertRow(row)
-            self.nco_table.setItem(row, 0, QTableWidgetItem(orgs.get(r.get('org_id'), '')))
-            self.nco_table.setItem(row, 1, QTableWidgetItem(comps.get(r.get('company_id'), '')))
-            comp_name = mcu_name.get(r.get('comp_mcu_id'), '')
-            # Add a small PDF button before the competitor MCU name
-            from PySide6.QtWidgets import QWidget, QHBoxLayout, QToolButton, QLabel
-            pdf_cell = QWidget()
-            ph = QHBoxLayout(pdf_cell)
-            ph.setContentsMargins(4, 0, 4, 0)
-            ph.setSpacing(6)
-            pdf_btn = QToolButton()
-            pdf_btn.setText('PDF')
-            pdf_btn.setCursor(QCursor(Qt.PointingHandCursor))
-            pdf_btn.setAutoRaise(True)
-            pdf_btn.setMinimumWidth(40)
-            pdf_btn.setFixedHeight(22)
-            pdf_btn.setToolTip('Open datasheet (local)')
-            pdf_btn.setStyleSheet(
-                "QToolButton {"
-                "  padding: 2px 8px;"
-                "  border: 1px solid #3a6cf4;"
-                "  border-radius: 11px;"
-                "  background-color: rgba(58,108,244,0.15);"
-                "  color: #ffffff;"
-                "  font-weight: 600;"
-                "}"
-                "QToolButton:hover { background-color: rgba(58,108,244,0.28); border-color: #5e86f7; }"
-                "QToolButton:pressed { background-color: rgba(58,108,244,0.40); border-color: #86a3fb; }"
-            )
-            # Keep name label next to button
-            name_lbl = QLabel(comp_name)
-            name_lbl.setContentsMargins(0,0,0,0)
-            name_lbl.setAlignment(Qt.AlignVCenter | Qt.AlignLeft)
-            # Connect button click to datasheet open
-            pdf_btn.clicked.connect(lambda _, nm=comp_name: self._download_datasheet(nm))
-            ph.addWidget(pdf_btn)
-            ph.addWidget(name_lbl)
-            ph.addStretch(1)
-            self.nco_table.setCellWidget(row, 2, pdf_cell)
+        self.nco_table.setRowCount(len(filtered))
+        for row, (r, nco, comp_name, cmcu) in enumerate(filtered):
+            # Entry id rides on the first column; set before insertion so it is not a separate change
+            item_org = QTableWidgetItem(nco)
+            item_org.setData(Qt.UserRole, r.get('id'))
+            self.nco_table.setItem(row, 0, item_org)
+            self.nco_table.setItem(row, 1, QTableWidgetItem(comp_name))
+            # Competitor MCU name; the column delegate paints the PDF pill in front of it
+            self.nco_table.setItem(row, 2, QTableWidgetItem(cmcu))
             self.nco_table.setItem(row, 3, QTableWidgetItem(str(r.get('quantity', 0))))
 
             # Determine our MCU and compute similarity
-            comp = self.db.get_mcu_by_id(int(r.get('comp_mcu_id')))
-            target = (({k: comp.get(k) for k in feat_cols}
-                      | {'name': comp.get('name', ''), 'is_dsp': comp.get('is_dsp'), 'is_fpga': comp.get('is_fpga')})
-                      if comp else {})
+            comp = mcu_by_id.get(int(r.get('comp_mcu_id')))
             our_id = r.get('our_mcu_id')
+            if comp:
+                best, score = nco_scores[(comp.get('company_id'), comp['id'], our_id)]
+            else:
+                # Unknown competitor MCU: nothing to compare
+                best, score = None, 0.0
             if our_id is None:
-                # compute best match across our MCUs
-                candidates = [{k: mm.get(k) for k in feat_cols} | {'id': mm['id'], 'name': mm['name']} for mm in our_mcus]
-                best, score, _ = best_match(target, candidates) if target else (None, 0.0, {})
                 our_name = best['name'] if best else ''
             else:
-                ours = self.db.get_mcu_by_id(int(our_id))
-                our_feats = {k: (ours.get(k) if ours else None) for k in feat_cols}
-                score, _ = weighted_similarity(target, our_feats) if target else (0.0, {})
                 our_name = mcu_name.get(our_id, '')
             self.nco_table.setItem(row, 4, QTableWidgetItem(our_name))
             item_score = QTableWidgetItem(f"{score:.1f}")
@@ -1088,35 +1583,16 @@ class MainWindow(QMainWindow):
             item_score.setData(Qt.EditRole, float(f"{score:.4f}"))
             self.nco_table.setItem(row, 5, item_score)
             cat = categorize(score)
-            # Backing item for category sorting by custom order
-            order_map = {'Best Match': 2, 'Partial': 1, 'No Match': 0}
-            cat_item = QTableWidgetItem(cat)
-            cat_item.setData(Qt.DisplayRole, cat)  # ensure visible label
-            cat_item.setTextAlignment(Qt.AlignCenter)
-            cat_item.setData(Qt.EditRole, order_map.get(cat, -1))
-            self.nco_table.setItem(row, 6, cat_item)
-            from PySide6.QtWidgets import QLabel
-            chip = QLabel(cat)
-            chip.setAlignment(Qt.AlignCenter)
-            color = CATEGORY_COLORS.get(cat, '#444')
-            chip.setStyleSheet(f"QLabel {{ background-color: {color}; color: white; border-radius: 10px; padding: 2px 6px; margin: 0px; }}")
-            chip.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
-            self.nco_table.setCellWidget(row, 6, chip)
-            # Fit row for PDF button height
-            try:
-                self.nco_table.setRowHeight(row, 36)
-            except Exception:
-                pass
-            # Store entry id on first column
-            if self.nco_table.item(row, 0):
-                self.nco_table.item(row, 0).setData(Qt.UserRole, r.get('id'))
+            self.nco_table.setItem(row, 6, _CategoryItem(cat))
+        self.nco_table.blockSignals(False)
+        self.nco_table.setUpdatesEnabled(True)
         # Restore sorting state
         if prev_sorting:
             self.nco_table.setSortingEnabled(True)
 
     def _on_nco_search_mode_change(self):
         # Update placeholder and refresh table according to selected search mode
-        if not hasattr(self, 'nco_search'):
+        if self.nco_search is None:
             return
         mode = self.nco_search_mode.currentText()
         placeholders = {
@@ -1130,7 +1606,7 @@ class MainWindow(QMainWindow):
         self._refresh_nco_table()
 
     def _load_nco_orgs(self):
-        if not hasattr(self, 'nco_org_combo'):
+        if self.nco_org_combo is None:
             return
         orgs = self.db.list_nco_orgs()
         current = self.nco_org_combo.currentData() if self.nco_org_combo.count() else None
@@ -1161,7 +1637,7 @@ class MainWindow(QMainWindow):
 
     def _rename_nco_org(self):
         from PySide6.QtWidgets import QInputDialog
-        if not hasattr(self, 'nco_org_combo') or self.nco_org_combo.count() == 0:
+        if self.nco_org_combo is None or self.nco_org_combo.count() == 0:
             return
         org_id = self.nco_org_combo.currentData()
         if org_id is None:
@@ -1175,7 +1651,7 @@ class MainWindow(QMainWindow):
                 self._refresh_nco_table()
 
     def _delete_nco_org(self):
-        if not hasattr(self, 'nco_org_combo') or self.nco_org_combo.count() == 0:
+        if self.nco_org_combo is None or self.nco_org_combo.count() == 0:
             return
         org_id = self.nco_org_combo.currentData()
         if org_id is None:
@@ -1206,15 +1682,14 @@ class MainWindow(QMainWindow):
                 act.setVisible(is_specific if self.tabs.currentIndex() == 1 else False)
 
     def _edit_selected_nco(self):
-        if not hasattr(self, 'nco_table') or self.nco_table.currentRow() < 0:
+        if self.nco_table is None or self.nco_table.currentRow() < 0:
             return
         row = self.nco_table.currentRow()
         entry_id = self.nco_table.item(row, 0).data(Qt.UserRole) if self.nco_table.item(row, 0) else None
         if entry_id is None:
             return
-        # Reconstruct entry dict
-        entries = self.db.list_nco_entries()
-        entry = next((e for e in entries if int(e.get('id', -1)) == int(entry_id)), None)
+        # Entry dict as loaded by the last NCO refresh; read it directly if that has gone stale
+        entry = self._nco_entries_by_id.get(int(entry_id)) or self.db.get_nco_entry_by_id(int(entry_id))
         if entry is None:
             return
         dlg = EditNcoEntryDialog(self.db, entry, self)
@@ -1222,7 +1697,7 @@ class MainWindow(QMainWindow):
             self._refresh_nco_table()
 
     def _delete_selected_nco(self):
-        if not hasattr(self, 'nco_table') or self.nco_table.currentRow() < 0:
+        if self.nco_table is None or self.nco_table.currentRow() < 0:
             return
         row = self.nco_table.currentRow()
         entry_id = self.nco_table.item(row, 0).data(Qt.UserRole) if self.nco_table.item(row, 0) else None
@@ -1236,7 +1711,7 @@ class MainWindow(QMainWindow):
 
     def _open_nco_details(self, row: int, column: int):
         # Open comparison details for the selected NCO entry
-        if not hasattr(self, 'nco_table'):
+        if self.nco_table is None:
             return
         item = self.nco_table.item(row, 0)
         if item is None:
@@ -1244,22 +1719,20 @@ class MainWindow(QMainWindow):
         entry_id = item.data(Qt.UserRole)
         if entry_id is None:
             return
-        entries = self.db.list_nco_entries()
-        entry = next((e for e in entries if int(e.get('id', -1)) == int(entry_id)), None)
+        entry = self._nco_entries_by_id.get(int(entry_id)) or self.db.get_nco_entry_by_id(int(entry_id))
         if not entry:
             return
         comp_id = int(entry.get('comp_mcu_id'))
         our_id = entry.get('our_mcu_id')
         if our_id is None:
             # Compute best match dynamically
-            feat_cols = self.db.feature_columns()
+            feat_cols = self._get_feature_columns()
             comp = self.db.get_mcu_by_id(comp_id)
             if not comp:
                 return
             target = {k: comp.get(k) for k in feat_cols}
-            our_mcus = [dict(r) for r in self.db.list_our_mcus()]
-            candidates = [{k: mm.get(k) for k in feat_cols} | {'id': mm['id'], 'name': mm['name']} for mm in our_mcus]
-            best, score, _ = best_match(target, candidates)
+            candidates, cand_columns = self._get_candidates()
+            best, score, _ = best_match(target, candidates, columns=cand_columns)
             # Guard: if best match equals competitor, do not open self-compare
             if best and int(best['id']) == int(comp_id):
                 QMessageBox.information(self, 'Details', 'Cannot compare an MCU against itself.')
@@ -1278,15 +1751,21 @@ class MainWindow(QMainWindow):
         dlg.exec()
 
     def _set_theme(self, theme: str):
+        # Cached PDF pill renderings were styled with the previous stylesheet
+        QPixmapCache.clear()
         base_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'ui')
         qss_file = 'styles_dark.qss' if theme == 'Dark' else 'styles_light.qss'
         qss_path = os.path.join(base_dir, qss_file)
         if not os.path.exists(qss_path):
             qss_path = os.path.join(base_dir, 'styles.qss')
         try:
-            if os.path.exists(qss_path):
+            # Re-read only when the file changed since it was cached
+            stamp = (qss_path, os.stat(qss_path).st_mtime_ns)
+            cached = self._qss_cache.get(theme)
+            if cached is None or cached[0] != stamp:
                 with open(qss_path, 'r', encoding='utf-8') as f:
-                    QApplication.instance().setStyleSheet(f.read())
+                    cached = self._qss_cache[theme] = (stamp, f.read())
+            QApplication.instance().setStyleSheet(cached[1])
         except Exception:
             pass
 
@@ -1295,7 +1774,11 @@ class MainWindow(QMainWindow):
         mode = self.search_mode.currentText()
         if mode == 'Company':
             self.search_edit.setPlaceholderText('Type to search companies')
-            self._load_companies()
+            if (self.search_edit.text() or '').lower() == self._company_search:
+                # Dropdown already holds this filter (e.g. empty search); only the table depends on the mode
+                self._refresh_table()
+            else:
+                self._load_companies()
         else:
             self.search_edit.setPlaceholderText('Type to search MCUs')
             # Keep companies dropdown as-is; table will use global MCU search
@@ -1304,29 +1787,44 @@ class MainWindow(QMainWindow):
     def _on_search_changed(self, *_):
         # When searching companies, update dropdown; for MCUs, refresh table
         if self.search_mode.currentText() == 'Company':
+            # Edits that net out within the debounce (or only change case) leave the list as is
+            if (self.search_edit.text() or '').lower() == self._company_search:
+                return
             self._load_companies()
         else:
             self._refresh_table()
 
     def _on_tab_changed(self, index: int):
         # 0 = Compare, 1 = NCO/Commission
+        if index == self._last_tab_index:
+            # Re-selection of the shown tab: widgets/actions already match it
+            return
+        self._last_tab_index = index
         is_compare = (index == 0)
-        # Compare actions/buttons enabled only on Compare tab
-        for act in [self.act_add_mcu, self.act_add_company, self.act_rename_company, self.act_delete_company]:
-            if act:
+        if index == 1 and self.nco_table is None:
+            self._build_nco_tab(self._nco_page)
+        # Hold repaints while the actions and toolbars flip; re-enabling schedules one update
+        self.setUpdatesEnabled(False)
+        try:
+            # Compare actions/toolbar enabled only on Compare tab
+            for act in self._compare_tab_actions:
                 act.setEnabled(is_compare)
                 act.setVisible(is_compare)
-        for w in [self.btn_edit_selected, self.btn_delete_selected, self.company_combo, self.search_mode, self.search_edit, self.compare_combo, self.cat_counts_label]:
-            if w:
-                w.setEnabled(is_compare)
-                w.setVisible(is_compare)
-        # NCO actions/buttons enabled only on NCO tab
-        is_nco = not is_compare
-        for act in [self.act_nco_add_org, self.act_nco_rename_org, self.act_nco_delete_org, self.act_nco_add_entry, self.act_nco_edit_selected, self.act_nco_delete_entry, self.act_nco_view]:
-            if act:
+            self.compare_panel.setEnabled(is_compare)
+            self.compare_panel.setVisible(is_compare)
+            # NCO actions/toolbar enabled only on NCO tab
+            is_nco = not is_compare
+            for act in self._nco_tab_actions:
                 act.setEnabled(is_nco)
                 act.setVisible(is_nco)
-        for w in [self.nco_org_combo, self.nco_add_btn, self.nco_search_mode, self.nco_search, self.nco_edit_btn]:
-            if hasattr(self, 'nco_org_combo') and w:
-                w.setEnabled(is_nco)
-                w.setVisible(is_nco)
+            if self.nco_panel is not None:
+                self.nco_panel.setEnabled(is_nco)
+                self.nco_panel.setVisible(is_nco)
+        finally:
+            self.setUpdatesEnabled(True)
+        if index in self._stale_tabs:
+            self._stale_tabs.discard(index)
+            if is_compare:
+                self._refresh_table()
+            else:
+                self._refresh_nco_table()